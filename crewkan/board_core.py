@@ -1,12 +1,18 @@
 # board_core.py
 
-import json
+import heapq
 import logging
+import os
+import time
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterable
 import yaml
 
-from crewkan.utils import load_yaml, save_yaml, now_iso, generate_task_id, generate_issue_id
+from crewkan.utils import (
+    load_yaml, load_yaml_many, save_yaml, move_yaml, now_iso, generate_task_id, generate_issue_id,
+    append_history, load_history, to_json, validate_yaml_data, SchemaValidationError,
+    PARALLEL_LOAD_THRESHOLD,
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -16,6 +22,64 @@ class BoardError(Exception):
     pass
 
 
+# Sort rank for issue priorities (higher = more important; unknown sorts last)
+PRIORITY_RANKS = {"high": 3, "medium": 2, "low": 1}
+
+
+def priority_value(priority: Optional[str]) -> int:
+    """Convert a priority string to its sort rank; a missing priority counts as medium."""
+    return PRIORITY_RANKS.get(priority or "medium", 0)
+
+
+def extract_comments(history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Pick the comment events out of an issue's history.
+
+    Returns:
+        Comment dicts with comment_id, at, by and details, oldest first
+    """
+    return [
+        {
+            "comment_id": entry.get("comment_id", ""),  # Backwards compatible
+            "at": entry.get("at", ""),
+            "by": entry.get("by", ""),
+            "details": entry.get("details", ""),
+        }
+        for entry in history
+        if entry.get("event") == "comment"
+    ]
+
+
+def _check_order_by(order_by: Optional[str]) -> None:
+    """Reject order_by values the issue listings don't support."""
+    if order_by not in (None, "priority"):
+        raise BoardError(f"Unknown order_by '{order_by}'")
+
+
+def _summarize_issues(
+    issues: List[Dict[str, Any]], limit: int, order_by: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Pick up to limit issues (ranked if order_by="priority") and summarize them."""
+    if order_by == "priority":
+        # Rank the raw issues (one lookup each) and summarize only the
+        # winners. nlargest matches a stable descending sort and slice, but
+        # is O(n) for the common limit=1 and O(n log limit) otherwise.
+        issues = heapq.nlargest(limit, issues, key=lambda i: priority_value(i.get("priority")))
+    return [
+        {
+            "id": issue.get("id"),
+            "title": issue.get("title"),
+            "column": issue.get("column"),
+            "issue_type": issue.get("issue_type", "task"),
+            "priority": issue.get("priority"),
+            "assignees": issue.get("assignees") or [],
+            "due_date": issue.get("due_date"),
+            "tags": issue.get("tags") or [],
+        }
+        for issue in issues[:limit]
+    ]
+
+
 class BoardClient:
     """
     Core client for filesystem-based board. All operations go through here.
@@ -36,21 +100,7 @@ class BoardClient:
                 f"File may be corrupted. Check logs for details."
             ) from e
         
-        try:
-            self.agents_data = load_yaml(
-                self.root / "agents" / "agents.yaml",
-                default={"agents": []}
-            )
-        except Exception as e:
-            raise BoardError(
-                f"Failed to load agents.yaml from {self.root}: {e}. "
-                f"File may be corrupted. Check logs for details."
-            ) from e
-        
-        if "agents" not in self.agents_data:
-            self.agents_data["agents"] = []
-
-        self._agent_index = {a["id"]: a for a in self.agents_data["agents"]}
+        self.reload_agents()
 
         if self.agent_id not in self._agent_index:
             raise BoardError(f"Unknown agent id '{self.agent_id}'")
@@ -91,6 +141,27 @@ class BoardClient:
     def list_agents(self) -> list[dict]:
         """Get list of all agents on the board."""
         return list(self._agent_index.values())
+
+    def reload_agents(self) -> None:
+        """
+        (Re)read agents.yaml, so agents added or changed since this client
+        was created are known to it.
+        """
+        try:
+            self.agents_data = load_yaml(
+                self.root / "agents" / "agents.yaml",
+                default={"agents": []}
+            )
+        except Exception as e:
+            raise BoardError(
+                f"Failed to load agents.yaml from {self.root}: {e}. "
+                f"File may be corrupted. Check logs for details."
+            ) from e
+        
+        if "agents" not in self.agents_data:
+            self.agents_data["agents"] = []
+
+        self._agent_index = {a["id"]: a for a in self.agents_data["agents"]}
     
     def get_issue_details(self, issue_id: str) -> dict:
         """Get full issue details including history/comments."""
@@ -101,16 +172,59 @@ class BoardClient:
     # Issue discovery
     # ------------------------------------------------------------------
 
-    def iter_issues(self):
+    def iter_issues(self, columns: Optional[Iterable[str]] = None):
         """
         Yield (path, data) for all issue YAML files.
+
+        Args:
+            columns: Only read issues filed under these column directories
         """
         if not self.issues_root.exists():
             return
-        for path in self.issues_root.rglob("*.yaml"):
-            data = load_yaml(path)
-            if isinstance(data, dict):
-                yield path, data
+        if columns is None:
+            paths = list(self.issues_root.rglob("*.yaml"))
+        else:
+            paths = []
+            for col in columns:
+                try:
+                    with os.scandir(self.issues_root / col) as entries:
+                        paths.extend(Path(e.path) for e in entries if e.name.endswith(".yaml") and e.is_file())
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+        # Large boards are read on a thread pool rather than one file at a
+        # time, a chunk at a time so callers that stop early (e.g. on reaching
+        # a limit) don't pay for parsing the rest
+        for start in range(0, len(paths), PARALLEL_LOAD_THRESHOLD):
+            chunk = paths[start:start + PARALLEL_LOAD_THRESHOLD]
+            for path, data in zip(chunk, load_yaml_many(chunk, use_lock="optimistic")):
+                if isinstance(data, dict):
+                    yield path, data
+
+    def list_recent(self, column: str, limit: int = 10) -> list[dict]:
+        """
+        Return the most recently written issues in a column, newest first.
+
+        Only the column's directory is listed and only the chosen files are
+        parsed. Moving an issue rewrites its file, so for "done" these are the
+        most recently completed issues.
+
+        Args:
+            column: Column whose issues to return
+            limit: Maximum number of issues
+        """
+        try:
+            with os.scandir(self.issues_root / column) as entries:
+                stamped = [
+                    (e.stat().st_mtime_ns, e.path)
+                    for e in entries if e.name.endswith(".yaml") and e.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        paths = [Path(path) for _, path in heapq.nlargest(limit, stamped)]
+        return [
+            data for data in load_yaml_many(paths, use_lock="optimistic")
+            if isinstance(data, dict)
+        ]
 
     def find_issue(self, issue_id: str) -> tuple[Path, dict]:
         """
@@ -119,7 +233,7 @@ class BoardClient:
         if not self.issues_root.exists():
             raise BoardError(f"Issue '{issue_id}' not found (issues directory does not exist)")
         for path in self.issues_root.rglob("*.yaml"):
-            data = load_yaml(path)
+            data = load_yaml(path, use_lock="optimistic")
             if isinstance(data, dict) and data.get("id") == issue_id:
                 return path, data
         raise BoardError(f"Issue '{issue_id}' not found")
@@ -128,35 +242,62 @@ class BoardClient:
     # Public operations used by tools
     # ------------------------------------------------------------------
 
-    def list_my_issues(self, column: str | None = None, limit: int = 50) -> str:
+    def list_my_issues(
+        self, column: str | None = None, limit: int = 50, order_by: str | None = None
+    ) -> str:
         """
         Return issues assigned to this agent, optionally filtered by column.
         Returns a JSON string of a list of issue summaries.
+
+        With order_by="priority", the highest priority issues are returned first
+        (ties keep board order); otherwise issues come back in board order.
+        """
+        return to_json(self.list_my_issues_objs(column, limit, order_by))
+
+    def list_my_issues_objs(
+        self, column: str | None = None, limit: int = 50, order_by: str | None = None
+    ) -> list[dict]:
+        """
+        Like list_my_issues(), but return the summaries as a list of dicts for
+        Python callers, skipping the JSON round trip.
         """
-        results = []
-        for _, issue in self.iter_issues():
-            assignees = issue.get("assignees") or []
-            if self.agent_id not in assignees:
+        _check_order_by(order_by)
+
+        matches = []
+        for _, issue in self.iter_issues(columns=(column,) if column else None):
+            if self.agent_id not in (issue.get("assignees") or []):
                 continue
             if column and issue.get("column") != column:
                 continue
-
-            results.append(
-                {
-                    "id": issue.get("id"),
-                    "title": issue.get("title"),
-                    "column": issue.get("column"),
-                    "issue_type": issue.get("issue_type", "task"),
-                    "priority": issue.get("priority"),
-                    "assignees": assignees,
-                    "due_date": issue.get("due_date"),
-                    "tags": issue.get("tags") or [],
-                }
-            )
-            if len(results) >= limit:
+            matches.append(issue)
+            if order_by is None and len(matches) >= limit:
                 break
 
-        return json.dumps(results, indent=2)
+        return _summarize_issues(matches, limit, order_by)
+
+    def list_my_issues_by_columns(
+        self, columns: Iterable[str], limit_each: int = 50, order_by: str | None = None
+    ) -> dict[str, list[dict]]:
+        """
+        List this agent's issues in several columns with one pass over the board.
+
+        Returns:
+            Column id -> issue summaries (as list_my_issues_objs() would return
+            for that column), with an entry for every requested column
+        """
+        _check_order_by(order_by)
+
+        columns = list(columns)
+        buckets: dict[str, list[dict]] = {col: [] for col in columns}
+        for _, issue in self.iter_issues(columns=columns):
+            if self.agent_id not in (issue.get("assignees") or []):
+                continue
+            bucket = buckets.get(issue.get("column"))
+            if bucket is None or (order_by is None and len(bucket) >= limit_each):
+                continue
+            bucket.append(issue)
+
+        return {col: _summarize_issues(bucket, limit_each, order_by) for col, bucket in buckets.items()}
 
     def move_issue(self, issue_id: str, new_column: str, notify_on_completion: bool = True) -> str:
         logger.info(f"Moving issue {issue_id} to column {new_column} (agent: {self.agent_id})")
@@ -180,23 +321,20 @@ class BoardClient:
         issue["column"] = new_column
         issue["status"] = new_column
         issue["updated_at"] = now_iso()
-        issue.setdefault("history", []).append(
+        append_history(
+            issue,
             {
                 "at": issue["updated_at"],
                 "by": self.agent_id,
                 "event": "moved",
                 "details": f"{old_column} -> {new_column}",
-            }
+            },
+            self.root,
         )
 
         # Move within issues/ directory
-        new_dir = self.issues_root / new_column
-        new_dir.mkdir(parents=True, exist_ok=True)
-        new_path = new_dir / path.name
-
-        save_yaml(new_path, issue)
-        if new_path != path:
-            path.unlink()
+        new_path = self.issues_root / new_column / path.name
+        move_yaml(path, new_path, issue)
 
         # Optional: update workspace symlinks
         self._update_workspace_links(issue_id, old_column, new_column)
@@ -255,13 +393,15 @@ class BoardClient:
             issue[field] = value
         
         issue["updated_at"] = now_iso()
-        issue.setdefault("history", []).append(
+        append_history(
+            issue,
             {
                 "at": issue["updated_at"],
                 "by": self.agent_id,
                 "event": "updated",
                 "details": f"{field}: '{old_value}' -> '{issue[field]}'",
-            }
+            },
+            self.root,
         )
         save_yaml(path, issue)
         return f"Updated issue {issue_id} field '{field}' from '{old_value}' to '{issue[field]}'."
@@ -270,11 +410,8 @@ class BoardClient:
         """
         Add a new comment event to an issue.
         """
-        import uuid
-        from crewkan.utils import now_iso
-        
         path, issue = self.find_issue(issue_id)
-        comment_id = f"C-{uuid.uuid4().hex[:8]}"
+        comment_id = f"C-{os.urandom(4).hex()}"
         issue["updated_at"] = now_iso()
         comment_entry = {
             "comment_id": comment_id,
@@ -283,7 +420,7 @@ class BoardClient:
             "event": "comment",
             "details": comment,
         }
-        issue.setdefault("history", []).append(comment_entry)
+        append_history(issue, comment_entry, self.root)
         save_yaml(path, issue)
         return comment_id
     
@@ -293,16 +430,7 @@ class BoardClient:
         Returns a list of comment dictionaries with comment_id, at, by, and details.
         """
         path, issue = self.find_issue(issue_id)
-        comments = []
-        for entry in issue.get("history", []):
-            if entry.get("event") == "comment":
-                comments.append({
-                    "comment_id": entry.get("comment_id", ""),  # Backwards compatible
-                    "at": entry.get("at", ""),
-                    "by": entry.get("by", ""),
-                    "details": entry.get("details", ""),
-                })
-        return comments
+        return extract_comments(load_history(self.root, issue))
 
     def reassign_issue(
         self,
@@ -343,13 +471,15 @@ class BoardClient:
 
         issue["assignees"] = sorted(assignees)
         issue["updated_at"] = now_iso()
-        issue.setdefault("history", []).append(
+        append_history(
+            issue,
             {
                 "at": issue["updated_at"],
                 "by": self.agent_id,
                 "event": "reassigned",
                 "details": changed,
-            }
+            },
+            self.root,
         )
         save_yaml(path, issue)
         
@@ -415,6 +545,57 @@ class BoardClient:
             issue_type: Type of issue - epic, user_story, task, bug, feature, improvement
                        (default: from board settings or "task")
         """
+        issue = self._new_issue(
+            time.gmtime(), title, description, column, assignees, priority, tags,
+            due_date, requested_by, issue_type,
+        )
+        self._save_new_issue(issue)
+        self._notify_assignees(issue)
+        return issue["id"]
+
+    def create_issues_bulk(self, specs: list[dict]) -> list[str]:
+        """
+        Create several issues at once. Returns the new issue ids, in order.
+        
+        Every spec is checked (columns, assignees and the issue schema) before
+        anything is written, so one bad spec creates no issues. The issues
+        share one creation timestamp.
+        
+        Args:
+            specs: Dicts of create_issue() keyword arguments (title required)
+        
+        Raises:
+            BoardError: If any spec is invalid
+        """
+        tm = time.gmtime()
+        issues = []
+        for spec in specs:
+            try:
+                issue = self._new_issue(tm, **spec)
+                validate_yaml_data(self._new_issue_path(issue), issue)
+            except (TypeError, SchemaValidationError) as e:
+                raise BoardError(f"Invalid issue spec {spec!r}: {e}") from e
+            issues.append(issue)
+        for issue in issues:
+            self._save_new_issue(issue, validate_schema=False)
+        for issue in issues:
+            self._notify_assignees(issue)
+        return [issue["id"] for issue in issues]
+
+    def _new_issue(
+        self,
+        tm: time.struct_time,
+        title: str,
+        description: str = "",
+        column: str = "backlog",
+        assignees: list[str] | None = None,
+        priority: str | None = None,
+        tags: list[str] | None = None,
+        due_date: str | None = None,
+        requested_by: str | None = None,
+        issue_type: str | None = None,
+    ) -> dict:
+        """Validate create_issue() arguments and build the issue dict."""
         if column not in self.columns:
             raise BoardError(f"Unknown column '{column}'")
 
@@ -425,8 +606,8 @@ class BoardClient:
 
         # Use issue_filename_prefix if available, otherwise task_filename_prefix for backwards compatibility
         prefix = self.settings.get("issue_filename_prefix") or self.settings.get("task_filename_prefix", "I")
-        issue_id: str = generate_issue_id(prefix)
-        created_at = now_iso()
+        issue_id: str = generate_issue_id(prefix, tm)
+        created_at = now_iso(tm)
 
         # Determine requested_by (use parameter if provided, otherwise use creating agent)
         requested_by_agent = requested_by if requested_by is not None else self.agent_id
@@ -435,7 +616,7 @@ class BoardClient:
         default_issue_type = self.settings.get("default_issue_type", "task")
         final_issue_type = issue_type or default_issue_type
         
-        issue = {
+        return {
             "id": issue_id,
             "title": title,
             "description": description or "",
@@ -460,15 +641,22 @@ class BoardClient:
             ],
         }
 
+    def _new_issue_path(self, issue: dict) -> Path:
+        """Where a freshly built issue is saved."""
         # Use issues/ directory for new issues
-        col_dir = self.issues_root / column
-        col_dir.mkdir(parents=True, exist_ok=True)
-        path = col_dir / f"{issue_id}.yaml"
-        save_yaml(path, issue)
-        logger.debug(f"Created issue {issue_id} at {path}")
-        
-        # Create assignment events for assigned agents (except creator)
-        for assignee in assignees:
+        return self.issues_root / issue["column"] / f"{issue['id']}.yaml"
+
+    def _save_new_issue(self, issue: dict, validate_schema: bool = True) -> None:
+        """Write a freshly built issue into its column directory."""
+        path = self._new_issue_path(issue)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        save_yaml(path, issue, validate_schema=validate_schema)
+        logger.debug(f"Created issue {issue['id']} at {path}")
+
+    def _notify_assignees(self, issue: dict) -> None:
+        """Create assignment events for a new issue's assignees (except the creator)."""
+        issue_id = issue["id"]
+        for assignee in issue["assignees"]:
             if assignee != self.agent_id:  # Don't notify self
                 try:
                     from crewkan.board_events import create_assignment_event
@@ -481,8 +669,6 @@ class BoardClient:
                     logger.info(f"Created assignment event for issue {issue_id}, notifying {assignee}")
                 except Exception as e:
                     logger.warning(f"Failed to create assignment event: {e}")
-        
-        return issue_id
 
     # ------------------------------------------------------------------
     # Workspace symlinks (optional for LangChain but handy)
@@ -25,6 +25,7 @@ Event Structure:
 """
 
 import logging
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from crewkan.utils import load_yaml, save_yaml, now_iso, generate_issue_id
@@ -64,13 +65,15 @@ def create_event(
     events_dir = get_events_dir(board_root, notify_agent)
     events_dir.mkdir(parents=True, exist_ok=True)
     
-    event_id = event_id or generate_issue_id(prefix="EVT")
+    # One clock read for both the id and created_at
+    tm = time.gmtime()
+    event_id = event_id or generate_issue_id(prefix="EVT", tm=tm)
     event_file = events_dir / f"{event_id}.yaml"
     
     event = {
         "id": event_id,
         "type": event_type,
-        "created_at": now_iso(),
+        "created_at": now_iso(tm),
         "created_by": created_by,
         "notify_agent": notify_agent,
         "status": "pending",
@@ -163,7 +166,7 @@ def list_pending_events(
         return []
     
     events = []
-    for event_file in sorted(events_dir.glob("*.yaml"), key=lambda p: p.stat().st_mtime, reverse=True):
+    for event_file in sorted(events_dir.glob("*.yaml"), key=lambda p: p.stat().st_mtime_ns, reverse=True):
         event = load_yaml(event_file)
         if not isinstance(event, dict):
             continue
@@ -0,0 +1,210 @@
+# board_index.py
+
+"""
+Persistent summary index of a board's task files.
+
+The index lives at `.cache/index.json` under the board root and maps each
+task file (relative path) to its size, mtime and a small summary of the task:
+
+{
+    "version": 1,
+    "files": {
+        "issues/todo/I-123.yaml": {
+            "mtime_ns": 1735689600000000000,
+            "size": 412,
+            "task": {"id": "I-123", "title": "...", "column": "todo", ...}
+        }
+    }
+}
+
+Every entry is checked against the file's current (mtime_ns, size), so hand
+edits and writes from other processes are always picked up; only new or
+changed files are parsed. The YAML files remain the source of truth and the
+index can be deleted at any time.
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+from crewkan.utils import load_yaml, load_yaml_header
+
+try:
+    import orjson  # Optional: faster (de)serialization of the index
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_RELPATH = Path(".cache") / "index.json"
+
+# Directories holding task files, relative to the board root ("tasks" is legacy)
+TASK_DIRS = ("tasks", "issues")
+
+# Task fields kept in the index; everything else needs the full YAML
+SUMMARY_FIELDS = (
+    "id", "title", "column", "status", "assignees", "priority", "tags", "due_date", "updated_at",
+)
+
+# Below this many changed files, parsing serially beats handing work to a pool
+PARALLEL_PARSE_THRESHOLD = 32
+
+
+def get_index_path(board_root: Path) -> Path:
+    """Get the path of the board's index file."""
+    return Path(board_root) / INDEX_RELPATH
+
+
+def summarize_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a task dict to the fields stored in the index."""
+    return {field: task.get(field) for field in SUMMARY_FIELDS if field in task}
+
+
+def _load_summary_source(path: Path) -> Optional[Dict[str, Any]]:
+    """Parse just the header of a task file, falling back to a full load."""
+    data = load_yaml_header(path)
+    if data is None:
+        data = load_yaml(path, use_lock="optimistic")
+    return data
+
+
+def _scan_task_files(board_root: Path) -> Dict[str, Tuple[int, int]]:
+    """Map relative path -> (mtime_ns, size) for every task file, in walk order."""
+    root = str(board_root)
+    files = {}
+    for dir_name in TASK_DIRS:
+        stack = [os.path.join(root, dir_name)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".yaml"):
+                        try:
+                            st = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        files[os.path.relpath(entry.path, root)] = (st.st_mtime_ns, st.st_size)
+    return files
+
+
+def _read_index(index_path: Path) -> Dict[str, Any]:
+    """Read the index file, returning an empty file map if missing or unusable."""
+    try:
+        with index_path.open("rb") as f:
+            raw = f.read()
+        index = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable board index {index_path}: {e}")
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    files = index.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_index(index_path: Path, files: Dict[str, Any]) -> None:
+    """Atomically write the index file; failures only cost a rebuild later."""
+    temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index = {"version": INDEX_VERSION, "files": files}
+        if orjson is not None:
+            raw = orjson.dumps(index)
+        else:
+            raw = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        with temp_path.open("wb") as f:
+            f.write(raw)
+        temp_path.replace(index_path)
+    except OSError as e:
+        logger.warning(f"Could not write board index {index_path}: {e}")
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_index(
+    board_root: Path,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Tuple[Path, Dict[str, Any]]]:
+    """
+    Return task summaries for the board, refreshing the on-disk index as needed.
+
+    Args:
+        board_root: Root directory of the board
+        executor: Optional executor used to parse changed files when there are
+            at least PARALLEL_PARSE_THRESHOLD of them
+
+    Returns:
+        {task_id: (path, summary)} in directory walk order
+
+    Raises:
+        YAMLError: If a changed task file is corrupted
+    """
+    board_root = Path(board_root)
+    index_path = get_index_path(board_root)
+    current = _scan_task_files(board_root)
+    indexed = _read_index(index_path)
+
+    files = {}
+    changed = [
+        rel for rel, (mtime_ns, size) in current.items()
+        if not (
+            rel in indexed
+            and indexed[rel].get("mtime_ns") == mtime_ns
+            and indexed[rel].get("size") == size
+        )
+    ]
+    if changed:
+        paths = [board_root / rel for rel in changed]
+        if executor is not None and len(paths) >= PARALLEL_PARSE_THRESHOLD:
+            loaded = executor.map(_load_summary_source, paths)
+        else:
+            loaded = map(_load_summary_source, paths)
+        parsed = dict(zip(changed, loaded))
+    else:
+        parsed = {}
+
+    for rel, (mtime_ns, size) in current.items():
+        if rel in parsed:
+            data = parsed[rel]
+            task = summarize_task(data) if isinstance(data, dict) else None
+            files[rel] = {"mtime_ns": mtime_ns, "size": size, "task": task}
+        else:
+            files[rel] = indexed[rel]
+
+    if changed or len(files) != len(indexed):
+        logger.debug(f"Updating board index {index_path} ({len(changed)} changed file(s))")
+        _write_index(index_path, files)
+
+    result = {}
+    for rel, entry in files.items():
+        task = entry.get("task")
+        if isinstance(task, dict) and task.get("id"):
+            result[task["id"]] = (board_root / rel, task)
+    return result
+
+
+def rebuild_index(board_root: Path) -> Dict[str, Tuple[Path, Dict[str, Any]]]:
+    """Discard the index file and rebuild it from every task file."""
+    invalidate_index(board_root)
+    return load_index(board_root)
+
+
+def invalidate_index(board_root: Path) -> None:
+    """Delete the board's index file, if any."""
+    try:
+        get_index_path(board_root).unlink()
+    except FileNotFoundError:
+        pass
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 from langchain_core.tools import StructuredTool, BaseTool
 
 from crewkan.board_core import BoardClient, BoardError
+from crewkan.utils import to_json
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -274,7 +275,7 @@ def make_event_tools(board_root: str, agent_id: str) -> list[BaseTool]:
         """List pending events/notifications for this agent."""
         try:
             events = list_pending_events(board_root, agent_id, event_type=event_type, limit=limit)
-            return json.dumps(events, indent=2)
+            return to_json(events)
         except Exception as e:
             return json.dumps({"error": str(e)})
     
@@ -291,7 +292,7 @@ def make_event_tools(board_root: str, agent_id: str) -> list[BaseTool]:
         try:
             event = get_event(board_root, agent_id, event_id)
             if event:
-                return json.dumps(event, indent=2)
+                return to_json(event)
             return f"Event {event_id} not found"
         except Exception as e:
             return f"ERROR: {e}"
@@ -3,11 +3,12 @@
 import argparse
 import sys
 import logging
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import yaml
 
-from crewkan.utils import load_yaml, save_yaml, now_iso, generate_issue_id
+from crewkan.utils import load_yaml, save_yaml, now_iso, generate_issue_id, append_history
 from crewkan.board_core import BoardClient, BoardError
 
 # Set up logging
@@ -144,8 +145,9 @@ def cmd_new_issue(args: argparse.Namespace) -> None:
                 raise RuntimeError(f"Unknown agent id '{a}'")
         
         prefix = board.get("settings", {}).get("issue_filename_prefix") or board.get("settings", {}).get("task_filename_prefix", "I")
-        issue_id = args.id or generate_issue_id(prefix=prefix)
-        created_at = now_iso()
+        tm = time.gmtime()
+        issue_id = args.id or generate_issue_id(prefix=prefix, tm=tm)
+        created_at = now_iso(tm)
         issue_type = getattr(args, 'issue_type', None) or board.get("settings", {}).get("default_issue_type", "task")
         
         issue = {
@@ -351,13 +353,15 @@ def cmd_start_issue(args: argparse.Namespace) -> None:
         issue["column"] = target_column
         issue["status"] = target_column
         issue["updated_at"] = now_iso()
-        issue.setdefault("history", []).append(
+        append_history(
+            issue,
             {
                 "at": issue["updated_at"],
                 "by": "cli",
                 "event": "moved",
                 "details": f"{old_column} -> {target_column}",
-            }
+            },
+            root,
         )
 
         save_yaml(new_path, issue)
@@ -4,7 +4,8 @@ import argparse
 import logging
 from pathlib import Path
 import sys
-import yaml
+
+from crewkan.utils import dump_yaml
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -40,7 +41,7 @@ def write_yaml(path: Path, data: dict, overwrite: bool = False):
         return
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False)
+        dump_yaml(data, f)
     print(f"Wrote {path}")
 
 
@@ -1,36 +1,53 @@
 #!/usr/bin/env python3
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict, Any
+import atexit
 import os
+import queue
 import sys
 import time
 import logging
 import json
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from crewkan.utils import load_yaml, save_yaml, now_iso, generate_task_id
-from crewkan.board_core import BoardClient, BoardError
+from crewkan.utils import load_yaml, save_yaml, move_yaml, now_iso, generate_task_id, append_history, load_history
+from crewkan import board_index
+from crewkan.board_core import BoardClient, extract_comments
 from crewkan.kanban_native import kanban_board
 
-# Set up logging to file in tmp directory
+try:
+    import orjson  # Optional: faster serialization of the kanban payload
+except ImportError:
+    orjson = None
+
+# Set up logging to a rotating file in tmp directory. Streamlit re-executes
+# this module on every rerun, so only install handlers once per process.
+# Records go through a queue and are written by a listener thread, so UI
+# actions never block on log I/O.
 log_dir = Path(__file__).resolve().parent.parent.parent / "tmp"
-log_dir.mkdir(parents=True, exist_ok=True)
-log_file = log_dir / f"crewkan_ui_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stderr),  # Also log to stderr
-    ]
-)
+log_file = log_dir / "crewkan_ui.log"
+
+_root_logger = logging.getLogger()
+if not any(isinstance(h, QueueHandler) for h in _root_logger.handlers):
+    log_dir.mkdir(parents=True, exist_ok=True)
+    _formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    _file_handler = RotatingFileHandler(log_file, maxBytes=5_000_000, backupCount=3, delay=True)
+    _file_handler.setFormatter(_formatter)
+    _stream_handler = logging.StreamHandler(sys.stderr)  # Also log to stderr
+    _stream_handler.setFormatter(_formatter)
+    _log_listener = QueueListener(queue.Queue(-1), _file_handler, _stream_handler)
+    _root_logger.addHandler(QueueHandler(_log_listener.queue))
+    _root_logger.setLevel(os.getenv("CREWKAN_LOG_LEVEL", "INFO").upper())
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 # Filter out noisy third-party loggers BEFORE creating our logger
 logging.getLogger("watchdog").setLevel(logging.WARNING)
@@ -41,10 +58,10 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
-logger.info(f"=== CrewKan UI Starting ===")
-logger.info(f"Log file: {log_file}")
-logger.info(f"Python: {sys.executable}")
-logger.info(f"Working directory: {os.getcwd()}")
+logger.info("=== CrewKan UI Starting ===")
+logger.info("Log file: %s", log_file)
+logger.info("Python: %s", sys.executable)
+logger.info("Working directory: %s", os.getcwd())
 
 # Get board root from environment variable (re-evaluated each time)
 def get_board_root() -> Path:
@@ -55,9 +72,38 @@ def get_board_root() -> Path:
 BOARD_ROOT = get_board_root()  # Initial value, but functions should call get_board_root()
 
 
+# Parsed versions of board.yaml / agents.yaml kept per file. Entries are keyed
+# by mtime, so they never go stale and need no TTL; the bound only drops old
+# versions of edited files.
+BOARD_FILE_CACHE_ENTRIES = 8
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return the file's mtime in nanoseconds, or -1 if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
+@st.cache_data(show_spinner=False, max_entries=BOARD_FILE_CACHE_ENTRIES)
+def _load_board_cached(root: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Parse board.yaml; mtime_ns is part of the cache key so edits invalidate it."""
+    return load_yaml(Path(root) / "board.yaml")
+
+
+@st.cache_data(show_spinner=False, max_entries=BOARD_FILE_CACHE_ENTRIES)
+def _load_agents_cached(root: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """Parse agents/agents.yaml; mtime_ns is part of the cache key so edits invalidate it."""
+    agents = load_yaml(Path(root) / "agents" / "agents.yaml", default={"agents": []})
+    if "agents" not in agents:
+        agents["agents"] = []
+    return agents["agents"]
+
+
 def load_board():
     board_root = get_board_root()
-    board = load_yaml(board_root / "board.yaml")
+    board = _load_board_cached(str(board_root), _mtime_ns(board_root / "board.yaml"))
     if not board:
         st.error(f"No board.yaml found in {board_root}")
         st.stop()
@@ -66,12 +112,121 @@ def load_board():
 
 def load_agents():
     board_root = get_board_root()
-    agents = load_yaml(board_root / "agents" / "agents.yaml", default={"agents": []})
-    if "agents" not in agents:
-        agents["agents"] = []
-    return agents["agents"]
+    return _load_agents_cached(str(board_root), _mtime_ns(board_root / "agents" / "agents.yaml"))
+
+
+def load_agent_map() -> Dict[str, Dict[str, Any]]:
+    """Return {agent_id: agent}, kept in session state until agents.yaml changes."""
+    board_root = get_board_root()
+    key = (str(board_root), _mtime_ns(board_root / "agents" / "agents.yaml"))
+    cached = st.session_state.get("agent_map")
+    if cached is None or cached[0] != key:
+        cached = (key, {a["id"]: a for a in load_agents()})
+        st.session_state["agent_map"] = cached
+    return cached[1]
+
+
+class _BoardWatcher:
+    """Keeps a revision counter bumped by *.yaml changes under tasks/ and issues/."""
 
+    def __init__(self, observer: Any) -> None:
+        self.observer = observer
+        self.revision = 0
 
+    def bump(self) -> None:
+        self.revision += 1
+
+
+@st.cache_resource
+def _get_board_watcher(board_root: str) -> Optional[_BoardWatcher]:
+    """
+    Start (once per process and board) a watchdog observer on the board.
+
+    Args:
+        board_root: Board root directory to watch
+
+    Returns:
+        The running watcher, or None if watchdog is unavailable or the
+        observer could not be started (e.g. on NFS/CIFS mounts), in which
+        case the task index falls back to scanning for changes.
+    """
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        logger.warning("watchdog not available, falling back to scanning for board changes")
+        return None
+
+    root = Path(board_root)
+    watched_dirs = tuple(str(root / d) + os.sep for d in ("tasks", "issues"))
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ("created", "deleted", "modified", "moved"):
+                return
+            # Only task files count: temp, lock and backup files written around
+            # every save must not trigger refreshes
+            paths = (event.src_path, getattr(event, "dest_path", "") or "")
+            if any(str(p).endswith(".yaml") and str(p).startswith(watched_dirs) for p in paths):
+                watcher.bump()
+
+    try:
+        observer = Observer()
+        watcher = _BoardWatcher(observer)
+        # Watch the board root so tasks/ or issues/ created later are also seen
+        observer.schedule(_Handler(), str(root), recursive=True)
+        observer.daemon = True
+        observer.start()
+    except Exception as e:
+        logger.warning("Could not start filesystem watcher on %s, falling back to scanning: %s", root, e)
+        return None
+    logger.info("Watching %s for task changes", root)
+    return watcher
+
+
+def _walk_yaml_stats(root: Path):
+    """
+    Yield (path string, stat result) for every *.yaml file under root.
+
+    Uses an explicit-stack os.scandir walk, so each file costs a single stat
+    and no Path objects are created while walking. Missing roots yield nothing.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".yaml"):
+                    try:
+                        yield entry.path, entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+
+def _scan_yaml_files(root: Path) -> Tuple[int, int]:
+    """
+    Count *.yaml files under root and find the newest mtime in one pass.
+
+    Returns:
+        (file count, newest st_mtime_ns), or (0, 0) if root doesn't exist
+    """
+    count = 0
+    latest = 0
+    for _, st_result in _walk_yaml_stats(root):
+        count += 1
+        latest = max(latest, st_result.st_mtime_ns)
+    return count, latest
+
+
+@st.cache_resource
+def _parse_executor() -> ThreadPoolExecutor:
+    """Process-wide thread pool for parsing task files, kept alive across reruns."""
+    return ThreadPoolExecutor(max_workers=16, thread_name_prefix="crewkan-parse")
 
 
 def iter_tasks():
@@ -80,61 +235,144 @@ def iter_tasks():
     
     # Check both 'tasks' and 'issues' directories for backwards compatibility
     for dir_name in ["tasks", "issues"]:
-        tasks_root = board_root / dir_name
-        if not tasks_root.exists():
-            continue
-        for path in tasks_root.rglob("*.yaml"):
-            data = load_yaml(path)
+        for path_str, _ in _walk_yaml_stats(board_root / dir_name):
+            path = Path(path_str)
+            data = load_yaml(path, use_lock="optimistic")
             if isinstance(data, dict):
                 yield path, data
 
 
-def move_task(task_data: Dict[str, Any], task_path: Path, new_column: str) -> None:
-    """Move task using BoardClient for proper updates."""
-    try:
-        # Use BoardClient for proper move
-        board_root = task_path.parent.parent.parent
+def _tasks_fingerprint() -> Tuple[str, str, int, int]:
+    """
+    Fingerprint of all task files, used to decide when to rebuild the index.
+
+    With a running watcher this is just its revision counter (O(1)); otherwise
+    it is the file count and newest mtime_ns from a directory scan.
+    """
+    board_root = get_board_root()
+    watcher = _get_board_watcher(str(board_root))
+    if watcher is not None:
+        return str(board_root), "revision", watcher.revision, 0
+    count = 0
+    latest_mtime = 0
+    for dir_name in ["tasks", "issues"]:
+        dir_count, dir_latest = _scan_yaml_files(board_root / dir_name)
+        count += dir_count
+        latest_mtime = max(latest_mtime, dir_latest)
+    return str(board_root), "scan", count, latest_mtime
+
+
+def load_task_index() -> Dict[str, Tuple[Path, Dict[str, Any]]]:
+    """
+    Return {task_id: (path, summary)} for all tasks, kept in session state.
+
+    Summaries hold the board-level fields only (see board_index.SUMMARY_FIELDS);
+    load the task file itself when full data is needed. The index is only
+    rebuilt when the task-file fingerprint changes, and then from the board's
+    persistent index so only changed files are parsed. Writes made by the UI
+    itself patch it in place via update_task_index().
+    """
+    cache = st.session_state.get("_board_cache")
+    fingerprint = _tasks_fingerprint()
+    if cache is None or cache["fingerprint"] != fingerprint:
+        tasks = board_index.load_index(get_board_root(), executor=_parse_executor())
+        cache = {"fingerprint": fingerprint, "tasks": tasks}
+        st.session_state["_board_cache"] = cache
+    return cache["tasks"]
+
+
+def update_task_index(
+    task_id: str, path: Path, task: Dict[str, Any], fingerprint_before: Tuple[str, str, int, int]
+) -> None:
+    """
+    Apply a successful UI write to the cached index instead of reloading the board.
+
+    The index can only be patched if nothing else changed since it was built:
+    adopting the post-write fingerprint would otherwise mark another process's
+    change as seen. If the board had moved on before the write, the index is
+    dropped and rebuilt on the next render instead.
+
+    Args:
+        task_id: ID of the written task
+        path: File the task was written to
+        task: Task data as written
+        fingerprint_before: _tasks_fingerprint() taken just before the write
+    """
+    cache = st.session_state.get("_board_cache")
+    if cache is None:
+        return
+    if cache["fingerprint"] != fingerprint_before:
+        st.session_state.pop("_board_cache", None)
+        return
+    cache["tasks"][task_id] = (path, board_index.summarize_task(task))
+    cache["fingerprint"] = _tasks_fingerprint()
+
+
+def _get_client() -> BoardClient:
+    """
+    Return the session's BoardClient, acting as the first agent on the board.
+
+    The client is kept in session state and only rebuilt when the board root,
+    board.yaml or agents.yaml changes, so UI actions don't redo constructor I/O.
+    """
+    board_root = get_board_root()
+    key = (
+        str(board_root),
+        _mtime_ns(board_root / "board.yaml"),
+        _mtime_ns(board_root / "agents" / "agents.yaml"),
+    )
+    cached = st.session_state.get("board_client")
+    if cached is None or cached[0] != key:
         agents = load_agents()
         default_agent = agents[0]["id"] if agents else "ui"
-        
-        client = BoardClient(board_root, default_agent)
+        cached = (key, BoardClient(board_root, default_agent))
+        st.session_state["board_client"] = cached
+    return cached[1]
+
+
+def move_task(task_data: Dict[str, Any], task_path: Path, new_column: str) -> Optional[Path]:
+    """
+    Move task using BoardClient for proper updates.
+
+    Returns:
+        The task's new path, or None if it was already in new_column
+    """
+    old_column = task_data.get("column", task_data.get("status"))
+    if old_column == new_column:
+        return None
+
+    try:
+        # Use BoardClient for proper move
+        client = _get_client()
         client.move_task(task_data["id"], new_column)
+        return client.issues_root / new_column / task_path.name
     except Exception as e:
         # Fallback to direct update
-        old_column = task_data.get("column", task_data.get("status"))
-        if old_column == new_column:
-            return
-
         task_data["column"] = new_column
         task_data["status"] = new_column
         task_data["updated_at"] = now_iso()
-        task_data.setdefault("history", []).append(
+        append_history(
+            task_data,
             {
                 "at": task_data["updated_at"],
                 "by": "ui",
                 "event": "moved",
                 "details": f"{old_column} -> {new_column}",
-            }
+            },
+            get_board_root(),
         )
 
-        board_root = get_board_root()
-        new_dir = board_root / "tasks" / new_column
-        new_dir.mkdir(parents=True, exist_ok=True)
-        new_path = new_dir / task_path.name
-        save_yaml(new_path, task_data)
-        if new_path != task_path:
-            task_path.unlink()
+        # Stay in the same tree (issues/ or legacy tasks/) so the file keeps its schema
+        new_path = task_path.parent.parent / new_column / task_path.name
+        move_yaml(task_path, new_path, task_data)
+        return new_path
 
 
 def assign_task(task_data: Dict[str, Any], task_path: Path, agent_id: str) -> None:
     """Assign task using BoardClient for proper updates."""
     try:
         # Use BoardClient for proper assignment
-        board_root = task_path.parent.parent.parent
-        agents = load_agents()
-        default_agent = agents[0]["id"] if agents else "ui"
-        
-        client = BoardClient(board_root, default_agent)
+        client = _get_client()
         client.reassign_task(task_data["id"], agent_id, keep_existing=True)
     except Exception as e:
         # Fallback to direct update
@@ -142,35 +380,57 @@ def assign_task(task_data: Dict[str, Any], task_path: Path, agent_id: str) -> No
         assignees.add(agent_id)
         task_data["assignees"] = sorted(assignees)
         task_data["updated_at"] = now_iso()
-        task_data.setdefault("history", []).append(
+        append_history(
+            task_data,
             {
                 "at": task_data["updated_at"],
                 "by": "ui",
                 "event": "assigned",
                 "details": f"Assigned {agent_id}",
-            }
+            },
+            get_board_root(),
         )
         save_yaml(task_path, task_data)
 
 
-def create_task(title: str, description: str, column_id: str, assignee_ids: List[str], priority: str, tags: str, due_date_str: Optional[str]) -> str:
-    """Create a task using BoardClient for proper updates."""
-    logger.info("=" * 50)
-    logger.info("create_task() FUNCTION CALLED")
-    logger.info(f"  title: '{title}'")
-    logger.info(f"  description: '{description}'")
-    logger.info(f"  column_id: {column_id}")
-    logger.info(f"  assignee_ids: {assignee_ids}")
-    logger.info(f"  priority: {priority}")
-    logger.info(f"  tags: '{tags}'")
-    logger.info(f"  due_date_str: {due_date_str}")
-    logger.info("=" * 50)
+def create_task(
+    title: str,
+    description: str,
+    column_id: str,
+    assignee_ids: List[str],
+    priority: str,
+    tags: str,
+    due_date_str: Optional[str],
+    board: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, Path]:
+    """
+    Create a task using BoardClient for proper updates.
+
+    Args:
+        board: The board dict, if the caller already loaded it this run;
+            load_board() is used otherwise
+
+    Returns:
+        (task_id, path written)
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=" * 50)
+        logger.debug("create_task() FUNCTION CALLED")
+        logger.debug("  title: '%s'", title)
+        logger.debug("  description: '%s'", description)
+        logger.debug("  column_id: %s", column_id)
+        logger.debug("  assignee_ids: %s", assignee_ids)
+        logger.debug("  priority: %s", priority)
+        logger.debug("  tags: '%s'", tags)
+        logger.debug("  due_date_str: %s", due_date_str)
+        logger.debug("=" * 50)
     
     try:
         # Use BoardClient for proper task creation
-        logger.info("Loading agents...")
+        logger.debug("Loading agents...")
         agents = load_agents()
-        logger.info(f"Loaded {len(agents)} agents: {[a.get('id') for a in agents]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded %d agents: %s", len(agents), [a.get("id") for a in agents])
         
         if not agents:
             error_msg = "No agents found in board. Please create at least one agent first."
@@ -178,16 +438,14 @@ def create_task(title: str, description: str, column_id: str, assignee_ids: List
             raise RuntimeError(error_msg)
         
         default_agent = agents[0]["id"]
-        logger.info(f"Using agent: {default_agent}")
+        logger.debug("Using agent: %s", default_agent)
         
         board_root = get_board_root()
-        logger.info(f"Board root: {board_root}")
+        logger.debug("Board root: %s", board_root)
         
-        logger.info("Creating BoardClient...")
-        client = BoardClient(board_root, default_agent)
-        logger.info("BoardClient created successfully")
+        client = _get_client()
         
-        logger.info("Calling client.create_task()...")
+        logger.debug("Calling client.create_task()...")
         task_id = client.create_task(
             title=title,
             description=description or "",
@@ -197,24 +455,27 @@ def create_task(title: str, description: str, column_id: str, assignee_ids: List
             tags=[t.strip() for t in tags.split(",") if t.strip()] if tags else [],
             due_date=due_date_str or None,
         )
-        logger.info(f"✅ Successfully created task {task_id} via BoardClient")
-        logger.info(f"Task file should be at: {board_root / 'tasks' / column_id / f'{task_id}.yaml'}")
-        return task_id
+        path = client.issues_root / column_id / f"{task_id}.yaml"
+        logger.info("✅ Successfully created task %s via BoardClient", task_id)
+        logger.debug("Task file should be at: %s", path)
+        return task_id, path
     except Exception as e:
         # Fallback to direct creation
-        logger.warning(f"BoardClient create_task failed, using fallback: {e}", exc_info=True)
-        logger.info("Attempting fallback creation method...")
+        logger.warning("BoardClient create_task failed, using fallback: %s", e, exc_info=True)
+        logger.debug("Attempting fallback creation method...")
         
-        board = load_board()
+        if board is None:
+            board = load_board()
         if not board:
             error_msg = "Cannot create task: board not loaded"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
         
         prefix = board.get("settings", {}).get("task_filename_prefix", "T")
-        task_id: str = generate_task_id(prefix)
-        created_at = now_iso()
-        logger.info(f"Generated task ID: {task_id}")
+        tm = time.gmtime()
+        task_id: str = generate_task_id(prefix, tm)
+        created_at = now_iso(tm)
+        logger.debug("Generated task ID: %s", task_id)
 
         task = {
             "id": task_id,
@@ -241,48 +502,106 @@ def create_task(title: str, description: str, column_id: str, assignee_ids: List
 
         board_root = get_board_root()
         col_dir = board_root / "tasks" / column_id
-        logger.info(f"Creating task directory: {col_dir}")
+        logger.debug("Creating task directory: %s", col_dir)
         col_dir.mkdir(parents=True, exist_ok=True)
         path = col_dir / f"{task_id}.yaml"
-        logger.info(f"Saving task to: {path}")
+        logger.debug("Saving task to: %s", path)
         save_yaml(path, task)
-        logger.info(f"✅ Successfully created task {task_id} via fallback method")
-        logger.info(f"Task file saved to: {path}")
-        return task_id
+        logger.info("✅ Successfully created task %s via fallback method", task_id)
+        logger.debug("Task file saved to: %s", path)
+        return task_id, path
+
+
+# Priority markers shown on the details page
+PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+# Header colors for the standard columns; anything else gets the todo blue
+DEFAULT_COLUMN_COLORS = {
+    "backlog": "#95a5a6",
+    "todo": "#3498db",
+    "doing": "#f39c12",
+    "blocked": "#e74c3c",
+    "done": "#27ae60",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _prepare_kanban_columns(root: str, board_mtime_ns: int) -> List[Dict[str, str]]:
+    """Build the kanban component's column list; board_mtime_ns keys the cache."""
+    board = _load_board_cached(root, board_mtime_ns) or {}
+    return [
+        {
+            "id": col.get("id", ""),
+            "name": col.get("name", col.get("id", "")),
+            "color": DEFAULT_COLUMN_COLORS.get(col.get("id", ""), "#3498db"),
+        }
+        for col in board.get("columns", [])
+    ]
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _build_kanban_payload(payload_key: Tuple, _columns: List[Dict[str, Any]], _tasks: List[Dict[str, Any]]) -> str:
+    """
+    Serialize the board for the kanban component, with tasks in columnar form.
+
+    Args:
+        payload_key: Hashable (columns, (id, column, updated_at) per task) key;
+            the underscore-prefixed arguments are not hashed by Streamlit
+        _columns: Column dicts with id, name and color
+        _tasks: Task dicts to render
+
+    Returns:
+        JSON string of {"columns": [...], "tasks_soa": {field: [values]}}
+    """
+    tasks_soa = {
+        "id": [t.get("id", "") for t in _tasks],
+        "title": [t.get("title", "Untitled") for t in _tasks],
+        "column": [t.get("column", "") for t in _tasks],
+        "priority": [t.get("priority", "medium") for t in _tasks],
+        "tags": [t.get("tags", []) for t in _tasks],
+    }
+    payload = {"columns": _columns, "tasks_soa": tasks_soa}
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"))
+
+
+# Seconds between checks for task file changes made outside this session
+BOARD_WATCH_INTERVAL = 3
+
+
+@st.fragment(run_every=BOARD_WATCH_INTERVAL)
+def _watch_board_changes() -> None:
+    """
+    Rerun the app when task files changed since the task index was built.
+
+    With a watcher the fingerprint is its revision counter, so an idle tick
+    is O(1); otherwise it is a single scandir pass over the board.
+    """
+    cache = st.session_state.get("_board_cache")
+    if cache is None:
+        return
+    fingerprint = _tasks_fingerprint()
+    if fingerprint != cache["fingerprint"]:
+        logger.info("Filesystem change detected (%s -> %s)", cache["fingerprint"], fingerprint)
+        st.rerun()
 
 
 def render_task_details_page(task_id: str, task_data: dict, path: Path) -> None:
     """Render a detailed task view page (Jira-style layout)."""
     board_root = get_board_root()
-    agents = load_agents()
-    agent_map = {a["id"]: a for a in agents}
+    agent_map = load_agent_map()
+    agents = list(agent_map.values())
     
     # Get BoardClient for API calls
-    default_agent = agents[0]["id"] if agents else "ui"
-    client = BoardClient(board_root, default_agent)
+    client = _get_client()
     
-    # Get comments - handle both tasks/ and issues/ directories
-    comments = []
-    try:
-        # Try to get comments via BoardClient (works for issues/)
-        comments = client.get_comments(task_id)
-    except BoardError as e:
-        # If task is in tasks/ directory, get comments from task data directly
-        if "issues directory does not exist" in str(e) or "not found" in str(e):
-            # Task might be in tasks/ directory, get comments from task_data history
-            comments = []
-            for entry in task_data.get("history", []):
-                if entry.get("event") == "comment":
-                    comments.append({
-                        "comment_id": entry.get("comment_id", ""),
-                        "at": entry.get("at", ""),
-                        "by": entry.get("by", ""),
-                        "details": entry.get("details", ""),
-                    })
-            logger.info(f"Task {task_id} not in issues/, using comments from task history")
-        else:
-            # Re-raise if it's a different error
-            raise
+    # Full history, including entries archived out of the task file
+    history = load_history(board_root, task_data)
+    
+    # Comments live in the task's history; task_data comes from the task index,
+    # so there's no need to search and re-parse the issue files via BoardClient
+    comments = extract_comments(history)
     
     # Back button
     if st.button("← Back to Board", key="back_to_board"):
@@ -308,8 +627,7 @@ def render_task_details_page(task_id: str, task_data: dict, path: Path) -> None:
         
         # Priority
         priority = task_data.get("priority", "medium")
-        priority_colors = {"high": "🔴", "medium": "🟡", "low": "🟢"}
-        st.markdown(f"**Priority:** {priority_colors.get(priority, '⚪')} {priority}")
+        st.markdown(f"**Priority:** {PRIORITY_EMOJI.get(priority, '⚪')} {priority}")
         
         # Assignees
         assignees = task_data.get("assignees", [])
@@ -367,7 +685,12 @@ def render_task_details_page(task_id: str, task_data: dict, path: Path) -> None:
         )
         if st.button("Move Task", key=f"detail_move_btn_{task_id}"):
             try:
-                client.move_task(task_id, new_col)
+                fingerprint = _tasks_fingerprint()
+                new_path = move_task(load_yaml(path), path, new_col)
+                if new_path is not None:
+                    # Patch the index now; the watcher may not have seen the move
+                    # by the time the rerun looks the task up
+                    update_task_index(task_id, new_path, load_yaml(new_path), fingerprint)
                 st.success(f"Moved to {new_col}")
                 st.rerun()
             except Exception as e:
@@ -382,7 +705,9 @@ def render_task_details_page(task_id: str, task_data: dict, path: Path) -> None:
         if st.button("Reassign", key=f"detail_reassign_btn_{task_id}"):
             if new_assignee != "(none)":
                 try:
+                    fingerprint = _tasks_fingerprint()
                     client.reassign_task(task_id, new_assignee, keep_existing=False)
+                    update_task_index(task_id, path, load_yaml(path), fingerprint)
                     st.success(f"Reassigned to {new_assignee}")
                     st.rerun()
                 except Exception as e:
@@ -408,7 +733,9 @@ def render_task_details_page(task_id: str, task_data: dict, path: Path) -> None:
             if st.button("Post Comment", key=f"post_comment_{task_id}"):
                 if new_comment.strip():
                     try:
+                        fingerprint = _tasks_fingerprint()
                         comment_id = client.add_comment(task_id, new_comment.strip())
+                        update_task_index(task_id, path, load_yaml(path), fingerprint)
                         st.success(f"Comment added (ID: {comment_id})")
                         st.rerun()
                     except Exception as e:
@@ -439,25 +766,177 @@ def render_task_details_page(task_id: str, task_data: dict, path: Path) -> None:
         # History (all events)
         st.markdown("---")
         st.header("History")
-        history = task_data.get("history", [])
         if history:
-            for entry in reversed(history):  # Show newest first
-                event = entry.get("event", "")
-                event_by = entry.get("by", "unknown")
-                event_at = entry.get("at", "")
-                event_details = entry.get("details", "")
-                
-                agent = agent_map.get(event_by, {})
-                agent_name = agent.get("name", event_by)
-                
-                st.markdown(f"**{event.upper()}** by {agent_name} at {event_at}")
-                if event_details:
-                    st.caption(event_details)
-                st.markdown("---")
+            # One table element instead of three elements per event
+            st.dataframe(
+                [
+                    {
+                        "When": entry.get("at", ""),
+                        "Event": entry.get("event", "").upper(),
+                        "By": agent_map.get(entry.get("by"), {}).get("name", entry.get("by", "unknown")),
+                        "Details": entry.get("details", ""),
+                    }
+                    for entry in reversed(history)  # Show newest first
+                ],
+                hide_index=True,
+            )
         else:
             st.markdown("_No history_")
 
 
+def _rerun_board() -> None:
+    """Rerun only the board fragment, or the whole app outside a fragment rerun."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+
+def _apply_board_move(
+    task_id: Optional[str],
+    from_column: Optional[str],
+    to_column: Optional[str],
+    task_paths: Dict[str, Path],
+    task_columns: Dict[str, str],
+) -> bool:
+    """
+    Apply one drag-drop move from the kanban component and patch the task index.
+
+    Returns:
+        True if a task file was moved
+    """
+    from_column = from_column or task_columns.get(task_id)
+    logger.info("🔄 Move event - Task: %s, From: %s, To: %s", task_id, from_column, to_column)
+
+    if task_id and task_columns.get(task_id) == to_column:
+        logger.debug("Task %s already in %s, nothing to move", task_id, to_column)
+        return False
+    if not task_id or task_id not in task_paths:
+        logger.warning("⚠️ Task %s not found on the board", task_id)
+        logger.warning("  Available task IDs: %s", list(task_paths)[:10])
+        return False
+
+    path = task_paths[task_id]
+    logger.debug("Drag-drop: Moving task %s from %s to %s (%s)", task_id, from_column, to_column, path)
+    try:
+        # A drop onto the task's own column changes nothing on disk
+        fingerprint = _tasks_fingerprint()
+        new_path = move_task(load_yaml(path), path, to_column)
+        if new_path is None:
+            return False
+        logger.info("✅ Successfully moved task %s to %s", task_id, to_column)
+        # Patch the task index with the moved file
+        update_task_index(task_id, new_path, load_yaml(new_path), fingerprint)
+        return True
+    except Exception as e:
+        logger.error("❌ Error moving task: %s", e, exc_info=True)
+        st.error(f"Error moving task: {e}")
+        return False
+
+
+@st.fragment
+def _render_board() -> None:
+    """
+    Render the kanban board and handle its drag-drop and click events.
+
+    Component events rerun only this fragment, so a drag-drop doesn't redo
+    the rest of the page; clicks still rerun the app to open the task page.
+    """
+    # Load all tasks in known columns
+    valid_columns = {c.get("id") for c in load_board().get("columns", [])}
+    all_tasks = []
+    task_paths: Dict[str, Path] = {}  # Event handlers only need path and column
+    task_columns: Dict[str, str] = {}
+    for task_id, (path, task) in load_task_index().items():
+        column = task.get("column")
+        if column in valid_columns:
+            all_tasks.append(task)
+            task_paths[task_id] = path
+            task_columns[task_id] = column
+
+    # Prepare columns for kanban component
+    board_root = get_board_root()
+    kanban_columns = _prepare_kanban_columns(str(board_root), _mtime_ns(board_root / "board.yaml"))
+
+    # Prepare tasks for kanban component; serialization is cached until a task changes
+    payload_key = (
+        tuple((c["id"], c["name"], c["color"]) for c in kanban_columns),
+        tuple((t.get("id"), t.get("column"), t.get("updated_at")) for t in all_tasks),
+    )
+    kanban_payload = _build_kanban_payload(payload_key, kanban_columns, all_tasks)
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Prepared %d tasks for kanban board", len(all_tasks))
+        logger.debug("Columns: %s", [c["id"] for c in kanban_columns])
+        logger.debug("Task columns: %s", [t.get("column") for t in all_tasks])
+
+    # Process kanban component return value (bi-directional component)
+    # The component returns events directly, no need for query params or postMessage
+
+    # Initialize event tracking in session state
+    # The component keeps returning its last value on every rerun, so remember
+    # recent event ids; the bounded deque drops the oldest automatically
+    if "kanban_processed_events" not in st.session_state:
+        st.session_state["kanban_processed_events"] = deque(maxlen=128)
+    
+    # Render native kanban board and get return value
+    # Use container with no padding for full-width display
+    try:
+        # Use a large height value - component will use viewport height anyway
+        with st.container():
+            result = kanban_board(
+                payload=kanban_payload,
+                height=2000,  # Large value, component uses viewport height
+                key="native_kanban_board",
+            )
+        
+        # Process component return value (events from drag-drop or clicks)
+        # Only process if we haven't seen this event before (deduplicate)
+        if result:
+            # Create unique event ID from event data
+            event_id = f"{result.get('type')}_{result.get('taskId')}_{result.get('timestamp', 0)}"
+            
+            # Skip if we've already processed this event
+            if event_id in st.session_state["kanban_processed_events"]:
+                logger.debug("⏭️ Skipping duplicate event: %s", event_id)
+            else:
+                # Mark as processed
+                st.session_state["kanban_processed_events"].append(event_id)
+                
+                logger.debug("🎯 Kanban component returned: %s", result)
+                event_type = result.get("type")
+                
+                if event_type in ("move", "move_batch"):
+                    # The frontend batches rapid drops; a lone "move" is one drop
+                    moves = (result.get("moves") or []) if event_type == "move_batch" else [result]
+                    moved = False
+                    for move in moves:
+                        moved |= _apply_board_move(
+                            move.get("taskId"), move.get("fromColumn"), move.get("toColumn"),
+                            task_paths, task_columns,
+                        )
+                    if moved:
+                        # Rerun just the board (served from the patched index)
+                        _rerun_board()
+                
+                elif event_type == "click":
+                    task_id = result.get("taskId")
+                    logger.info("🖱️ Click event - Task: %s", task_id)
+                    if task_id and task_id in task_paths:
+                        logger.debug("Task clicked: %s", task_id)
+                        st.session_state["viewing_task"] = task_id
+                        st.rerun()
+                    else:
+                        logger.warning("⚠️ Task %s not found for click", task_id)
+                    
+    except Exception as e:
+        logger.error("Error rendering kanban board: %s", e, exc_info=True)
+        st.error(f"Error rendering kanban board: {e}")
+        import traceback
+        st.code(traceback.format_exc())
+
+
+
 def main() -> None:
     # Configure page for full-screen kanban
     st.set_page_config(
@@ -497,17 +976,19 @@ def main() -> None:
         </style>
     """, unsafe_allow_html=True)
     
-    logger.info("=== Main function called ===")
-    logger.info(f"Session state keys: {list(st.session_state.keys())}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=== Main function called ===")
+        logger.debug("Session state keys: %s", list(st.session_state.keys()))
 
     # Check if we're viewing a task details page
     if "viewing_task" in st.session_state:
         task_id = st.session_state["viewing_task"]
-        # Find the task
-        for path, task in iter_tasks():
-            if task.get("id") == task_id:
-                render_task_details_page(task_id, task, path)
-                return
+        # Look the task up in the same index the board render uses
+        entry = load_task_index().get(task_id)
+        task = load_yaml(entry[0]) if entry is not None and entry[0].exists() else None
+        if isinstance(task, dict):
+            render_task_details_page(task_id, task, entry[0])
+            return
         # Task not found, clear and show board
         del st.session_state["viewing_task"]
         st.rerun()
@@ -520,48 +1001,14 @@ def main() -> None:
             st.rerun()
     with button_col2:
         if st.button("🔄 Refresh", use_container_width=True, key="refresh_btn"):
-            st.session_state["last_task_mtime"] = 0
+            st.session_state.pop("_board_cache", None)
             st.rerun()
     with button_col3:
         st.write("")  # Spacer
 
-    # Smart filesystem change detection - only check when not processing form submission
-    # Initialize last check time
-    if "last_check" not in st.session_state:
-        st.session_state.last_check = time.time()
-        st.session_state.last_file_hash = None
-    
-    # Only check for filesystem changes if we're not in the middle of form processing
-    # This prevents interference with form submission
-    form_processing = st.session_state.get("form_processing", False)
-    
-    if not form_processing:
-        current_time = time.time()
-        # Check every 3 seconds (less frequent to reduce interference)
-        if current_time - st.session_state.last_check > 3.0:
-            st.session_state.last_check = current_time
-            
-            # Check if task files have changed by comparing file modification times
-            board_root = get_board_root()
-            tasks_root = board_root / "tasks"
-            
-            if tasks_root.exists():
-                # Get latest modification time of any task file
-                latest_mtime = 0
-                for task_file in tasks_root.rglob("*.yaml"):
-                    if task_file.is_file():
-                        mtime = task_file.stat().st_mtime
-                        latest_mtime = max(latest_mtime, mtime)
-                
-                # Compare with last known modification time
-                last_mtime = st.session_state.get("last_task_mtime", 0)
-                
-                if latest_mtime > last_mtime:
-                    logger.info(f"Filesystem change detected (mtime: {latest_mtime} > {last_mtime})")
-                    st.session_state["last_task_mtime"] = latest_mtime
-                    # Only rerun if we're not in a form context
-                    if not st.session_state.get("in_form_context", False):
-                        st.rerun()
+    # Filesystem change detection runs in its own fragment, so its ticks don't
+    # rerun the page (or interrupt the new task form) unless tasks changed
+    _watch_board_changes()
 
     board = load_board()
     agents = load_agents()
@@ -597,7 +1044,8 @@ def main() -> None:
                         st.error("Title is required")
                     else:
                         try:
-                            task_id = create_task(
+                            fingerprint = _tasks_fingerprint()
+                            task_id, task_file = create_task(
                                 title.strip(),
                                 description.strip() if description else "",
                                 column_id,
@@ -605,161 +1053,19 @@ def main() -> None:
                                 priority,
                                 tag_str.strip() if tag_str else "",
                                 due_date_str.strip() or None,
+                                board=board,
                             )
                             st.success(f"✅ Created task {task_id}")
                             st.session_state["show_new_task_modal"] = False
-                            # Update last modification time
-                            board_root = get_board_root()
-                            tasks_root = board_root / "tasks" / column_id
-                            task_file = tasks_root / f"{task_id}.yaml"
-                            if task_file.exists():
-                                st.session_state["last_task_mtime"] = task_file.stat().st_mtime
+                            # Patch the task index with the new file
+                            update_task_index(task_id, task_file, load_yaml(task_file), fingerprint)
                             st.rerun()
                         except Exception as e:
                             st.error(f"Error creating task: {e}")
-                            logger.error(f"Error creating task: {e}", exc_info=True)
+                            logger.error("Error creating task: %s", e, exc_info=True)
 
-    # Load all tasks
-    all_tasks = []
-    task_path_map = {}  # Map task_id to (path, task) for quick lookup
-    
-    for path, task in iter_tasks():
-        col = task.get("column")
-        if col not in col_ids:
-            continue
-        all_tasks.append(task)
-        task_path_map[task.get("id")] = (path, task)
-
-    # Prepare columns for kanban component
-    kanban_columns = []
-    default_colors = {
-        "backlog": "#95a5a6",
-        "todo": "#3498db",
-        "doing": "#f39c12",
-        "blocked": "#e74c3c",
-        "done": "#27ae60",
-    }
-    
-    for col in columns:
-        col_id = col.get("id", "")
-        col_name = col.get("name", col_id)
-        color = default_colors.get(col_id, "#3498db")
-        kanban_columns.append({
-            "id": col_id,
-            "name": col_name,
-            "color": color,
-        })
-
-    # Prepare tasks for kanban component
-    kanban_tasks = []
-    for task in all_tasks:
-        task_col = task.get("column", "")
-        task_id = task.get("id", "")
-        task_title = task.get("title", "Untitled")
-        
-        # Log for debugging
-        logger.debug(f"Preparing task: {task_id} - '{task_title}' in column '{task_col}'")
-        
-        kanban_tasks.append({
-            "id": task_id,
-            "title": task_title,
-            "column": task_col,
-            "priority": task.get("priority", "medium"),
-            "tags": task.get("tags", []),
-        })
-    
-    logger.info(f"Prepared {len(kanban_tasks)} tasks for kanban board")
-    logger.info(f"Columns: {[c['id'] for c in kanban_columns]}")
-    logger.info(f"Task columns: {[t['column'] for t in kanban_tasks]}")
-
-    # Process kanban component return value (bi-directional component)
-    # The component returns events directly, no need for query params or postMessage
-
-    # Initialize event tracking in session state
-    if "kanban_processed_events" not in st.session_state:
-        st.session_state["kanban_processed_events"] = set()
-    
-    # Render native kanban board and get return value
-    # Use container with no padding for full-width display
-    try:
-        # Use a large height value - component will use viewport height anyway
-        with st.container():
-            result = kanban_board(
-                columns=kanban_columns,
-                tasks=kanban_tasks,
-                height=2000,  # Large value, component uses viewport height
-                key="native_kanban_board",
-            )
-        
-        # Process component return value (events from drag-drop or clicks)
-        # Only process if we haven't seen this event before (deduplicate)
-        if result:
-            # Create unique event ID from event data
-            event_id = f"{result.get('type')}_{result.get('taskId')}_{result.get('timestamp', 0)}"
-            
-            # Skip if we've already processed this event
-            if event_id in st.session_state["kanban_processed_events"]:
-                logger.debug(f"⏭️ Skipping duplicate event: {event_id}")
-            else:
-                # Mark as processed
-                st.session_state["kanban_processed_events"].add(event_id)
-                # Keep only last 100 events to prevent memory growth
-                if len(st.session_state["kanban_processed_events"]) > 100:
-                    oldest = min(st.session_state["kanban_processed_events"], 
-                                key=lambda x: int(x.split('_')[-1]) if x.split('_')[-1].isdigit() else 0)
-                    st.session_state["kanban_processed_events"].discard(oldest)
-                
-                logger.info(f"🎯 Kanban component returned: {result}")
-                event_type = result.get("type")
-                
-                if event_type == "move":
-                    task_id = result.get("taskId")
-                    from_column = result.get("fromColumn")
-                    to_column = result.get("toColumn")
-                    
-                    logger.info(f"🔄 Move event - Task: {task_id}, From: {from_column}, To: {to_column}")
-                    
-                    if task_id and task_id in task_path_map:
-                        path, task = task_path_map[task_id]
-                        logger.info(f"✅ Task found in map. Path: {path}")
-                        logger.info(f"Drag-drop: Moving task {task_id} from {from_column} to {to_column}")
-                        try:
-                            move_task(task, path, to_column)
-                            logger.info(f"✅ Successfully moved task {task_id} to {to_column}")
-                            # Update last modification time
-                            board_root = get_board_root()
-                            # Check both tasks and issues directories
-                            for dir_name in ["tasks", "issues"]:
-                                tasks_root = board_root / dir_name / to_column
-                                task_file = tasks_root / f"{task_id}.yaml"
-                                if task_file.exists():
-                                    st.session_state["last_task_mtime"] = task_file.stat().st_mtime
-                                    logger.info(f"✅ Updated mtime from {task_file}")
-                                    break
-                            # Rerun to refresh the board
-                            st.rerun()
-                        except Exception as e:
-                            logger.error(f"❌ Error moving task: {e}", exc_info=True)
-                            st.error(f"Error moving task: {e}")
-                    else:
-                        logger.warning(f"⚠️ Task {task_id} not found in task_path_map")
-                        logger.warning(f"  Available task IDs: {list(task_path_map.keys())[:10]}")
-                
-                elif event_type == "click":
-                    task_id = result.get("taskId")
-                    logger.info(f"🖱️ Click event - Task: {task_id}")
-                    if task_id and task_id in task_path_map:
-                        logger.info(f"Task clicked: {task_id}")
-                        st.session_state["viewing_task"] = task_id
-                        st.rerun()
-                    else:
-                        logger.warning(f"⚠️ Task {task_id} not found for click")
-                    
-    except Exception as e:
-        logger.error(f"Error rendering kanban board: {e}", exc_info=True)
-        st.error(f"Error rendering kanban board: {e}")
-        import traceback
-        st.code(traceback.format_exc())
+    # The board is a fragment, so drag-drop events don't rerun the page above
+    _render_board()
 
 
 if __name__ == "__main__":
@@ -4,23 +4,37 @@
 File locking mechanism using .lck files as semaphores.
 
 This provides basic protection against read-update-write race conditions
-in multi-process/multi-agent scenarios.
+in multi-process/multi-agent scenarios. The lock itself is an OS-level lock
+(`fcntl.flock` on POSIX, `msvcrt.locking` on Windows) held on the .lck file,
+so acquisition is atomic and the kernel drops it if the holder dies.
+
+Within a process, locks on the same file share one `threading.RLock` and one
+OS lock: threads queue on the RLock without touching the kernel, and a thread
+that already holds the lock can take it again (e.g. a `load_yaml` inside a
+`with FileLock(path):` block) instead of deadlocking on itself.
 """
 
 import logging
+import os
+import threading
 import time
 from pathlib import Path
-from typing import Optional
-from contextlib import contextmanager
+from typing import Optional, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for acquiring locks (seconds)
 DEFAULT_LOCK_TIMEOUT = 30.0
-# Default retry interval (seconds)
+# Longest wait between attempts on a contended lock (seconds)
 DEFAULT_RETRY_INTERVAL = 0.1
-# Maximum lock age before considering stale (seconds)
-MAX_LOCK_AGE = 300  # 5 minutes
+# First wait between attempts; doubles up to retry_interval
+INITIAL_RETRY_INTERVAL = 0.001
 
 
 class LockError(Exception):
@@ -28,9 +42,70 @@ class LockError(Exception):
     pass
 
 
+def _try_lock_fd(fd: int) -> bool:
+    """Try to take an exclusive, non-blocking OS lock on fd."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except BlockingIOError:
+        return False
+    except OSError:
+        # msvcrt reports contention as EACCES/EDEADLK rather than EWOULDBLOCK
+        if fcntl is None:
+            return False
+        raise
+
+
+def _unlock_fd(fd: int) -> None:
+    """Drop the OS lock taken by _try_lock_fd."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class _PathLock:
+    """Process-wide state for one lock file, shared by every FileLock on it."""
+    
+    __slots__ = ("rlock", "depth", "fd", "users")
+    
+    def __init__(self):
+        self.rlock = threading.RLock()
+        self.depth = 0  # Nested holds by the owning thread
+        self.fd: Optional[int] = None  # OS lock, held while depth > 0
+        self.users = 0  # FileLocks holding or waiting; the entry goes at 0
+
+
+_registry: Dict[str, _PathLock] = {}
+_registry_lock = threading.Lock()
+
+
+def _checkout(key: str) -> _PathLock:
+    """Get (creating if needed) the shared state for a lock file."""
+    with _registry_lock:
+        entry = _registry.get(key)
+        if entry is None:
+            entry = _registry[key] = _PathLock()
+        entry.users += 1
+        return entry
+
+
+def _checkin(key: str, entry: _PathLock) -> None:
+    """Drop a reference taken by _checkout, forgetting unused lock files."""
+    with _registry_lock:
+        entry.users -= 1
+        if entry.users == 0:
+            del _registry[key]
+
+
 class FileLock:
     """
-    A simple file-based lock using .lck files.
+    A file-based lock using an OS lock on a .lck file.
     
     Usage:
         with FileLock(path):
@@ -43,79 +118,145 @@ class FileLock:
         file_path: Path,
         timeout: float = DEFAULT_LOCK_TIMEOUT,
         retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        resolve: bool = True,
     ):
-        self.file_path = Path(file_path).resolve()
+        """
+        Args:
+            file_path: File to lock; the lock lives next to it as <name>.lck
+            timeout: Seconds to wait for the lock
+            retry_interval: Longest wait between attempts
+            resolve: Resolve symlinks in file_path. Callers whose paths are
+                built from an already-resolved root can pass False to skip
+                the per-component readlink() calls.
+        """
+        if resolve:
+            self.file_path = Path(file_path).resolve()
+        else:
+            self.file_path = Path(os.path.abspath(file_path))
         self.lock_path = self.file_path.with_suffix(self.file_path.suffix + ".lck")
         self.timeout = timeout
         self.retry_interval = retry_interval
+        self._key = str(self.lock_path)
+        self._entry: Optional[_PathLock] = None
+        self._holds = 0
     
-    def _is_lock_stale(self) -> bool:
-        """Check if lock file is stale (older than MAX_LOCK_AGE)."""
-        if not self.lock_path.exists():
-            return False
-        
+    def _acquire(self) -> Optional[int]:
+        """Try to take the OS lock once. Returns the locked fd if successful."""
         try:
-            lock_age = time.time() - self.lock_path.stat().st_mtime
-            return lock_age > MAX_LOCK_AGE
-        except OSError:
-            return False
-    
-    def _acquire(self) -> bool:
-        """Try to acquire the lock. Returns True if successful."""
-        # Check if lock exists and is not stale
-        if self.lock_path.exists():
-            if self._is_lock_stale():
-                logger.warning(
-                    f"Stale lock detected for {self.file_path}, removing it. "
-                    f"Lock age: {time.time() - self.lock_path.stat().st_mtime:.1f}s"
-                )
-                try:
-                    self.lock_path.unlink()
-                except OSError as e:
-                    logger.warning(f"Failed to remove stale lock: {e}")
-                    return False
-            else:
-                return False  # Lock is held by another process
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+        except OSError as e:
+            logger.debug(f"Failed to open lock file: {e}")
+            return None
         
-        # Try to create lock file
         try:
-            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
-            self.lock_path.write_text(f"{time.time()}\n", encoding="utf-8")
-            return True
+            if not _try_lock_fd(fd):
+                os.close(fd)
+                return None
+            # The previous holder unlinks the file on release; if it did so
+            # between our open and lock, we hold a lock on an orphaned inode.
+            if fcntl is not None:
+                try:
+                    current = os.stat(self.lock_path)
+                except FileNotFoundError:
+                    current = None
+                held = os.fstat(fd)
+                if current is None or (current.st_dev, current.st_ino) != (held.st_dev, held.st_ino):
+                    os.close(fd)
+                    return None
+            # Holder info for debugging only; the OS lock is what matters
+            os.ftruncate(fd, 0)
+            os.write(fd, f"{os.getpid()} {time.time()}\n".encode("ascii"))
         except OSError as e:
-            logger.debug(f"Failed to create lock file: {e}")
-            return False
+            logger.debug(f"Failed to lock {self.lock_path}: {e}")
+            os.close(fd)
+            return None
+        
+        return fd
+    
+    def _acquire_os_lock(self, deadline: float) -> Optional[int]:
+        """Retry _acquire with backoff until it succeeds or the deadline passes."""
+        delay = min(INITIAL_RETRY_INTERVAL, self.retry_interval)
+        while True:
+            fd = self._acquire()
+            if fd is not None:
+                return fd
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.retry_interval)
     
     def acquire(self) -> bool:
         """
         Acquire the lock, waiting up to timeout seconds.
         Returns True if lock was acquired, False otherwise.
+        
+        Re-acquiring in a thread that already holds the lock succeeds at once.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + self.timeout
+        entry = _checkout(self._key)
         
-        while time.time() - start_time < self.timeout:
-            if self._acquire():
-                logger.debug(f"Acquired lock for {self.file_path}")
-                return True
-            time.sleep(self.retry_interval)
+        acquired = entry.rlock.acquire(timeout=max(self.timeout, 0))
+        if acquired and entry.depth == 0:
+            # First hold in this process: take the OS lock for other processes
+            entry.fd = self._acquire_os_lock(deadline)
+            if entry.fd is None:
+                entry.rlock.release()
+                acquired = False
         
-        logger.warning(
-            f"Failed to acquire lock for {self.file_path} "
-            f"within {self.timeout}s timeout"
-        )
-        return False
+        if not acquired:
+            _checkin(self._key, entry)
+            logger.warning(
+                f"Failed to acquire lock for {self.file_path} "
+                f"within {self.timeout}s timeout"
+            )
+            return False
+        
+        entry.depth += 1
+        self._entry = entry
+        self._holds += 1
+        logger.debug(f"Acquired lock for {self.file_path}")
+        return True
     
     def release(self):
-        """Release the lock by removing the lock file."""
+        """Release the lock, removing the lock file once no holds remain."""
+        if self._holds == 0:
+            return
+        entry = self._entry
+        self._holds -= 1
+        if self._holds == 0:
+            self._entry = None
+        
+        entry.depth -= 1
         try:
-            if self.lock_path.exists():
+            if entry.depth == 0:
+                fd, entry.fd = entry.fd, None
+                self._release_os_lock(fd)
+        finally:
+            entry.rlock.release()
+            _checkin(self._key, entry)
+    
+    def _release_os_lock(self, fd: int) -> None:
+        """Unlink the lock file and drop the OS lock on fd."""
+        try:
+            # Unlink while still holding the lock so waiters re-check the inode
+            try:
                 self.lock_path.unlink()
-                logger.debug(f"Released lock for {self.file_path}")
+            except FileNotFoundError:
+                pass
+            except OSError:
+                if fcntl is not None:
+                    raise
+                # Windows can't remove an open file; leaving it is harmless
+            _unlock_fd(fd)
+            logger.debug(f"Released lock for {self.file_path}")
         except OSError as e:
             logger.warning(f"Failed to release lock for {self.file_path}: {e}")
             raise LockError(f"Failed to release lock: {e}")
+        finally:
+            os.close(fd)
     
-    @contextmanager
     def __enter__(self):
         """Context manager entry."""
         if not self.acquire():
@@ -123,10 +264,7 @@ class FileLock:
                 f"Could not acquire lock for {self.file_path} "
                 f"within {self.timeout}s"
             )
-        try:
-            yield self
-        finally:
-            self.release()
+        return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
@@ -137,6 +275,7 @@ class FileLock:
 def acquire_file_lock(
     file_path: Path,
     timeout: float = DEFAULT_LOCK_TIMEOUT,
+    resolve: bool = True,
 ) -> FileLock:
     """
     Acquire a lock for a file. Returns a FileLock context manager.
@@ -146,5 +285,5 @@ def acquire_file_lock(
             # Critical section
             ...
     """
-    return FileLock(file_path, timeout=timeout)
+    return FileLock(file_path, timeout=timeout, resolve=resolve)
 
@@ -38,7 +38,12 @@ else:
         path=str(build_dir)
     )
 
-def kanban_board(columns, tasks, height=800, key=None):
+# Task fields the frontend renders; anything else (description, history,
+# dependencies, ...) would only add to the serialized payload
+TASK_FIELDS = ("id", "title", "column", "priority", "tags")
+
+
+def kanban_board(columns=None, tasks=None, height=800, key=None, payload=None):
     """
     Render a native Kanban board with drag-and-drop support.
     
@@ -58,24 +63,39 @@ def kanban_board(columns, tasks, height=800, key=None):
         - priority: str - "high", "medium", or "low" (optional)
         - tags: list of str - Task tags (optional)
     
+        Other keys are dropped before the tasks are sent to the frontend.
+        Ignored when ``payload`` is given.
+    
     height : int, default=800
         Height of the board in pixels
     
     key : str, optional
         Unique key for component state management
     
+    payload : str, optional
+        Pre-serialized JSON ``{"columns": [...], "tasks_soa": {...}}`` where
+        ``tasks_soa`` holds one list per task field (id, title, column,
+        priority, tags). Lets callers cache serialization between reruns;
+        the frontend also uses the string itself as its change hash.
+    
     Returns
     -------
     dict or None
         Component return value with:
-        - type: "move" or "click"
+        - type: "move", "move_batch" or "click"
         - taskId: Task ID
         - fromColumn: Source column (for moves)
         - toColumn: Target column (for moves)
+        - moves: list of {taskId, fromColumn, toColumn} (for move_batch;
+          drops made within ~50ms of each other are posted together)
         - timestamp: int - Event timestamp
     """
     
     # Call the component and return its value
+    if payload is not None:
+        return _component_func(payload=payload, height=height, key=key)
+    if tasks is not None:
+        tasks = [{k: t[k] for k in TASK_FIELDS if k in t} for t in tasks]
     return _component_func(
         columns=columns,
         tasks=tasks,
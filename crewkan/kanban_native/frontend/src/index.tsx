@@ -12,6 +12,18 @@ let draggedFromColumn: string | null = null;
 let lastFrameHeight: number = 0;
 let lastRenderData: string = "";  // For detecting actual data changes
 
+// Expand columnar task data ({id: [...], title: [...], ...}) into task objects
+function tasksFromColumnar(soa: any): any[] {
+    const ids: string[] = soa.id || [];
+    return ids.map((id: string, i: number) => ({
+        id: id,
+        title: soa.title[i],
+        column: soa.column[i],
+        priority: soa.priority[i],
+        tags: soa.tags[i],
+    }));
+}
+
 // Initialize component
 function initComponent() {
     // Create the main container
@@ -20,6 +32,15 @@ function initComponent() {
     container.className = 'kanban-container';
     document.body.appendChild(container);
     
+    // Delegated event handlers: attached once here rather than to every
+    // column/card on each render, so re-renders never accumulate listeners
+    container.addEventListener('dragstart', handleDragStart);
+    container.addEventListener('dragend', handleDragEnd);
+    container.addEventListener('dragover', handleDragOver);
+    container.addEventListener('dragleave', handleDragLeave);
+    container.addEventListener('drop', handleDrop);
+    container.addEventListener('click', handleTaskClick);
+    
     // Tell Streamlit we're ready
     Streamlit.setComponentReady();
     
@@ -28,18 +49,25 @@ function initComponent() {
     Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, (event: any) => {
         const renderData = event.detail;
         const args = renderData.args || {};
-        const newColumns = args.columns || [];
-        const newTasks = args.tasks || [];
+        const payload: string | null = args.payload || null;
         const newHeight = args.height || 800;
         
-        // Create a hash of the data to detect actual changes
-        const dataHash = JSON.stringify({columns: newColumns, tasks: newTasks});
+        // A pre-serialized payload is its own change hash; otherwise hash the args
+        const dataHash = payload !== null
+            ? payload
+            : JSON.stringify({columns: args.columns || [], tasks: args.tasks || []});
         
         // Only update if data actually changed
         if (dataHash !== lastRenderData) {
             lastRenderData = dataHash;
-            columns = newColumns;
-            tasks = newTasks;
+            if (payload !== null) {
+                const parsed = JSON.parse(payload);
+                columns = parsed.columns || [];
+                tasks = tasksFromColumnar(parsed.tasks_soa || {});
+            } else {
+                columns = args.columns || [];
+                tasks = args.tasks || [];
+            }
             height = newHeight;
             
             // Set container height to viewport (ignore passed height for full-screen)
@@ -143,16 +171,7 @@ function renderBoard() {
 
         columnDiv.appendChild(body);
 
-        // Drag and drop handlers - attach to both column and body
-        columnDiv.addEventListener('dragover', handleDragOver);
-        columnDiv.addEventListener('drop', handleDrop);
-        columnDiv.addEventListener('dragleave', handleDragLeave);
-        
-        // Also attach to body for drops on empty areas
-        body.addEventListener('dragover', handleDragOver);
-        body.addEventListener('drop', handleDrop);
-        body.addEventListener('dragleave', handleDragLeave);
-
+        // Drag/drop/click events are handled by the delegated container listeners
         container.appendChild(columnDiv);
     });
     
@@ -224,22 +243,26 @@ function createTaskCard(task: any, columnId: string): HTMLElement {
     
     card.appendChild(meta);
 
-    // Drag handlers
-    card.addEventListener('dragstart', handleDragStart);
-    card.addEventListener('dragend', handleDragEnd);
-    card.addEventListener('click', () => handleTaskClick(task.id));
-
     return card;
 }
 
-function handleTaskClick(taskId: string) {
-    sendClickEvent(taskId);
+// Find the task card or column an event happened in (for delegated handlers)
+function closestFromEvent(e: Event, selector: string): HTMLElement | null {
+    const target = e.target as HTMLElement | null;
+    return target && target.closest ? (target.closest(selector) as HTMLElement | null) : null;
+}
+
+function handleTaskClick(e: MouseEvent) {
+    const card = closestFromEvent(e, '.task-card');
+    if (card && card.dataset.taskId) {
+        sendClickEvent(card.dataset.taskId);
+    }
 }
 
 // Drag handlers
 function handleDragStart(e: DragEvent) {
-    if (!e.target) return;
-    const target = e.target as HTMLElement;
+    const target = closestFromEvent(e, '.task-card');
+    if (!target) return;
     draggedTask = target;
     draggedFromColumn = target.dataset.columnId || null;
     target.classList.add('dragging');
@@ -257,20 +280,19 @@ function handleDragOver(e: DragEvent) {
         e.dataTransfer.dropEffect = 'move';
     }
     
-    // Find the column (could be column div or body)
-    const column = (e.currentTarget as HTMLElement).closest('.kanban-column') || e.currentTarget;
-    if (column && (column as HTMLElement).classList.contains('kanban-column')) {
-        (column as HTMLElement).classList.add('drag-over');
+    // Find the column the pointer is over (column div, body or a card inside it)
+    const column = closestFromEvent(e, '.kanban-column');
+    if (column) {
+        column.classList.add('drag-over');
     }
     
     return false;
 }
 
 function handleDragLeave(e: DragEvent) {
-    // Find the column (could be column div or body)
-    const column = (e.currentTarget as HTMLElement).closest('.kanban-column') || e.currentTarget;
-    if (column && (column as HTMLElement).classList.contains('kanban-column')) {
-        (column as HTMLElement).classList.remove('drag-over');
+    const column = closestFromEvent(e, '.kanban-column');
+    if (column) {
+        column.classList.remove('drag-over');
     }
 }
 
@@ -280,7 +302,7 @@ function handleDrop(e: DragEvent) {
     
     if (!draggedTask) return;
     
-    const targetColumn = (e.currentTarget as HTMLElement).closest('.kanban-column');
+    const targetColumn = closestFromEvent(e, '.kanban-column');
     if (!targetColumn) {
         console.error('Could not find target column');
         return false;
@@ -311,9 +333,14 @@ function handleDrop(e: DragEvent) {
 }
 
 function handleDragEnd(e: DragEvent) {
-    if (e.target) {
-        (e.target as HTMLElement).classList.remove('dragging');
+    const card = closestFromEvent(e, '.task-card');
+    if (card) {
+        card.classList.remove('dragging');
     }
+    clearDragState();
+}
+
+function clearDragState() {
     document.querySelectorAll('.kanban-column').forEach(col => {
         col.classList.remove('drag-over');
     });
@@ -321,20 +348,66 @@ function handleDragEnd(e: DragEvent) {
     draggedFromColumn = null;
 }
 
+// Moves are queued and posted together, so a burst of drags costs one
+// Streamlit rerun instead of one per drop
+const MOVE_BATCH_DELAY_MS = 50;
+let pendingMoves: { taskId: string, fromColumn: string, toColumn: string }[] = [];
+let moveFlushTimer: number | null = null;
+
 // Send events to Streamlit
 function sendMoveEvent(taskId: string, fromColumn: string | null, toColumn: string | null) {
     if (!fromColumn || !toColumn) return;
     
+    // A task dragged twice in one burst only needs its final column
+    const existing = pendingMoves.find(m => m.taskId === taskId);
+    if (existing) {
+        existing.toColumn = toColumn;
+    } else {
+        pendingMoves.push({ taskId: taskId, fromColumn: fromColumn, toColumn: toColumn });
+    }
+    pendingMoves = pendingMoves.filter(m => m.fromColumn !== m.toColumn);
+    
+    // Show the move right away; the next render from Python confirms it.
+    // Re-rendering removes the dragged card, so its dragend never fires:
+    // reset the drag state here instead.
+    const task = tasks.find(t => t.id === taskId);
+    if (task) {
+        task.column = toColumn;
+        renderBoard();
+    }
+    clearDragState();
+    
+    if (moveFlushTimer !== null) {
+        window.clearTimeout(moveFlushTimer);
+    }
+    moveFlushTimer = window.setTimeout(
+        () => window.requestAnimationFrame(flushMoves),
+        MOVE_BATCH_DELAY_MS
+    );
+}
+
+function flushMoves() {
+    if (moveFlushTimer !== null) {
+        window.clearTimeout(moveFlushTimer);
+        moveFlushTimer = null;
+    }
+    if (pendingMoves.length === 0) return;
+    
+    const moves = pendingMoves;
+    pendingMoves = [];
+    // The board now shows these moves locally. If Python rejects one, it sends
+    // back the same payload as before; forget it so that render still repaints.
+    lastRenderData = "";
     Streamlit.setComponentValue({
-        type: 'move',
-        taskId: taskId,
-        fromColumn: fromColumn,
-        toColumn: toColumn,
+        type: 'move_batch',
+        moves: moves,
         timestamp: Date.now()
     });
 }
 
 function sendClickEvent(taskId: string) {
+    // Don't let a click overwrite moves that haven't been posted yet
+    flushMoves();
     Streamlit.setComponentValue({
         type: 'click',
         taskId: taskId,
@@ -1,12 +1,30 @@
 # utils.py - Shared utilities for CrewKan
 
+import copy
+import functools
+import json
 import logging
+import os
+import random
+import re
+import shutil
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Iterable, List, Union
 import yaml
-import uuid
+
+try:
+    import yamale
+except ImportError:
+    yamale = None
+
+try:
+    import orjson  # Optional: faster JSON for tool responses
+except ImportError:
+    orjson = None
 
 from crewkan.file_locking import FileLock, LockError
 
@@ -19,12 +37,47 @@ AGENTS_SCHEMA = SCHEMA_DIR / "agents_schema.yaml"
 TASK_SCHEMA = SCHEMA_DIR / "task_schema.yaml"  # Keep for backwards compatibility
 ISSUE_SCHEMA = SCHEMA_DIR / "issue_schema.yaml"
 
+# Column directories whose files are validated as tasks/issues
+TASK_COLUMN_DIRS = frozenset({"todo", "doing", "done", "backlog", "blocked"})
+
 # Current schema version
 SCHEMA_VERSION = 1
 
+# Use libyaml's C loader/dumper when PyYAML was built with it (much faster
+# than the pure-Python implementation); resolved once at import time
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+if _YAML_LOADER is yaml.SafeLoader:
+    logger.warning("PyYAML was built without libyaml; using the slower pure-Python YAML parser")
+
+# Parsed-file cache: path -> ((st_ino, st_mtime_ns, st_size), validated, data).
+# Bounded LRU; entries are invalidated by any change to the file's identity key.
+YAML_CACHE_MAX_ENTRIES = 4096
+_yaml_cache: "OrderedDict[Path, tuple]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+# Compiled yamale schemas: schema path -> (st_mtime_ns, schema)
+_schema_cache: Dict[Path, Tuple[int, Any]] = {}
+
+# Top-level keys holding bulky task content that summaries don't need
+BODY_KEYS = frozenset({"description", "history", "dependencies"})
+_TOP_LEVEL_KEY = re.compile(r"([A-Za-z_][\w-]*):(?:\s|$)")
+
+# Batches of at least this many files are loaded on a shared thread pool;
+# below it, handing work to the pool costs more than it saves
+PARALLEL_LOAD_THRESHOLD = 32
+LOAD_MAX_WORKERS = 16
+_load_executor: Optional[ThreadPoolExecutor] = None
+_load_executor_lock = threading.Lock()
+
+# Task history kept in the YAML file; older entries are moved to an
+# append-only JSONL log at <board_root>/.history/<task_id>.jsonl
+HISTORY_MAX_ENTRIES = 50
+HISTORY_DIRNAME = ".history"
+
 # Retry configuration
-MAX_RETRIES = 3
-RETRY_DELAY = 0.1  # seconds
+MAX_RETRIES = 5
+RETRY_DELAY = 0.1  # seconds; base of the jittered exponential backoff
 
 
 class YAMLError(Exception):
@@ -37,9 +90,66 @@ class SchemaValidationError(Exception):
     pass
 
 
-def now_iso():
-    """Return current time in ISO format with Z suffix."""
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retry number attempt + 1, jittered so contending writers spread out."""
+    return RETRY_DELAY * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def to_json(obj: Any) -> str:
+    """
+    Serialize obj as indented JSON, as returned to agents by the board tools.
+    Uses orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def now_iso(tm: Optional[time.struct_time] = None) -> str:
+    """
+    Return current time in ISO format with Z suffix.
+    
+    Args:
+        tm: UTC time from time.gmtime() to format instead of now, so related
+            timestamps (e.g. an issue id and its created_at) can share one
+            clock read
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", tm or time.gmtime())
+
+
+@functools.lru_cache(maxsize=4096)
+def _schema_for(path_str: str) -> Optional[Path]:
+    """Pick the schema a file is validated against from its path."""
+    if "board.yaml" in path_str:
+        return BOARD_SCHEMA
+    if "agents.yaml" in path_str:
+        return AGENTS_SCHEMA
+    path = Path(path_str)
+    if path.parent.name in TASK_COLUMN_DIRS:
+        # Check if in issues/ directory (new) or tasks/ directory (old)
+        if "issues" in path_str or path.parent.parent.name == "issues":
+            return ISSUE_SCHEMA
+        # Backwards compatibility: use TASK_SCHEMA for tasks/ directory
+        return TASK_SCHEMA
+    return None
+
+
+def _get_schema(schema_path: Path) -> Optional[Any]:
+    """
+    Return the compiled yamale schema for schema_path, or None if it's missing.
+    
+    Schemas are compiled once and reused until the file's mtime changes.
+    """
+    try:
+        mtime_ns = schema_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _schema_cache.get(schema_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    schema = yamale.make_schema(schema_path)
+    _schema_cache[schema_path] = (mtime_ns, schema)
+    return schema
 
 
 def _validate_schema(data: Dict[str, Any], schema_path: Path, file_path: Path) -> None:
@@ -54,22 +164,19 @@ def _validate_schema(data: Dict[str, Any], schema_path: Path, file_path: Path) -
     Raises:
         SchemaValidationError: If validation fails
     """
-    try:
-        import yamale
-    except ImportError:
+    if yamale is None:
         logger.warning("yamale not available, skipping schema validation")
         return
     
-    if not schema_path.exists():
+    schema = _get_schema(schema_path)
+    if schema is None:
         logger.warning(f"Schema file {schema_path} not found, skipping validation")
         return
     
     try:
-        schema = yamale.make_schema(schema_path)
-        # Convert dict to YAML string for yamale (yamale.make_data expects a string, not a dict)
-        yaml_str = yaml.dump(data, default_flow_style=False)
-        yaml_data = yamale.make_data(content=yaml_str)
-        yamale.validate(schema, yaml_data)
+        # yamale.validate() takes the [(data, path)] list make_data() would
+        # build, so the dict is validated as-is without a dump/parse round trip
+        yamale.validate(schema, [(data, str(file_path))])
         logger.debug(f"Schema validation passed for {file_path}")
     except yamale.YamaleError as e:
         error_msg = f"Schema validation failed for {file_path}: {e}"
@@ -77,38 +184,76 @@ def _validate_schema(data: Dict[str, Any], schema_path: Path, file_path: Path) -
         raise SchemaValidationError(error_msg) from e
 
 
-def _ensure_version(data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+def validate_yaml_data(path: Path, data: Dict[str, Any]) -> None:
     """
-    Ensure data has a version field. Adds version if missing.
+    Check data against the schema save_yaml() would validate it with for path,
+    without writing anything.
     
     Args:
-        data: Data dictionary
-        file_path: Path to file (for logging)
+        path: Path the data is going to be saved to
+        data: Data to check (gets a version field, as save_yaml() would add)
     
-    Returns:
-        Data with version field
+    Raises:
+        SchemaValidationError: If schema validation fails
     """
-    if "version" not in data:
-        logger.debug(f"Adding version field to {file_path}")
-        data["version"] = SCHEMA_VERSION
-    return data
+    data.setdefault("version", SCHEMA_VERSION)
+    schema_path = _schema_for(str(path))
+    if schema_path:
+        _validate_schema(data, schema_path, path)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached parse results (mainly for tests)."""
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+
+
+def _yaml_cache_get(path: Path, key: tuple) -> Optional[tuple]:
+    """Return (validated, data) for path if cached under key, else None."""
+    with _yaml_cache_lock:
+        entry = _yaml_cache.get(path)
+        if entry is None or entry[0] != key:
+            return None
+        _yaml_cache.move_to_end(path)
+        return entry[1], entry[2]
+
+
+def _yaml_cache_put(path: Path, key: tuple, validated: bool, data: Dict[str, Any]) -> None:
+    """Store a parse result, evicting least recently used entries beyond the limit."""
+    with _yaml_cache_lock:
+        _yaml_cache[path] = (key, validated, data)
+        _yaml_cache.move_to_end(path)
+        while len(_yaml_cache) > YAML_CACHE_MAX_ENTRIES:
+            _yaml_cache.popitem(last=False)
+
+
+def _yaml_cache_discard(path: Path) -> None:
+    """Forget any cached parse result for path."""
+    with _yaml_cache_lock:
+        _yaml_cache.pop(path, None)
 
 
 def load_yaml(
     path: Path,
     default=None,
     validate_schema: bool = True,
-    use_lock: bool = True,
+    use_lock: Union[bool, str] = True,
     retry_on_error: bool = True,
 ) -> Optional[Dict[str, Any]]:
     """
     Load YAML file with error handling, retry logic, and optional schema validation.
     
+    Parse results are cached by (inode, mtime_ns, size), so unchanged files are
+    not re-parsed. Each call returns its own deep copy, so callers may mutate it.
+    
     Args:
         path: Path to YAML file
         default: Default value if file doesn't exist
         validate_schema: Whether to validate against schema
-        use_lock: Whether to use file locking
+        use_lock: Whether to use file locking. "optimistic" reads without the
+            lock first and only re-reads under it if that read can't be
+            parsed; save_yaml() replaces files atomically, so a lock-free
+            read normally sees a complete file
         retry_on_error: Whether to retry on errors
     
     Returns:
@@ -122,32 +267,34 @@ def load_yaml(
         return default
     
     # Determine schema based on file path
-    schema_path = None
-    if "board.yaml" in str(path):
-        schema_path = BOARD_SCHEMA
-    elif "agents.yaml" in str(path):
-        schema_path = AGENTS_SCHEMA
-    elif path.parent.name in ["todo", "doing", "done", "backlog", "blocked"]:
-        # Check if in issues/ directory (new) or tasks/ directory (old)
-        if "issues" in str(path) or path.parent.parent.name == "issues":
-            schema_path = ISSUE_SCHEMA
-        else:
-            # Backwards compatibility: use TASK_SCHEMA for tasks/ directory
-            schema_path = TASK_SCHEMA
+    schema_path = _schema_for(str(path))
     
-    lock = FileLock(path) if use_lock else None
+    # Board paths are built from a resolved root, so skip resolving again
+    lock = FileLock(path, resolve=False) if use_lock else None
     
     def _do_load():
         try:
-            with path.open("r", encoding="utf-8") as f:
-                content = f.read()
+            # Stat before reading: if the file changes in between, the entry is
+            # stored under the older key and simply misses next time
+            st = path.stat()
+            cache_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+            cached = _yaml_cache_get(path, cache_key)
+            if cached is not None:
+                validated, data = cached
+                if validate_schema and schema_path and not validated:
+                    _validate_schema(data, schema_path, path)
+                    _yaml_cache_put(path, cache_key, True, data)
+                return copy.deepcopy(data)
             
-            if not content.strip():
+            if st.st_size == 0:
                 logger.warning(f"Empty file {path}, returning default")
                 return default
             
             try:
-                data = yaml.safe_load(content)
+                # Parse straight from the binary handle; the loader decodes
+                # the UTF-8 itself, so no intermediate str copy is made
+                with path.open("rb") as f:
+                    data = yaml.load(f, Loader=_YAML_LOADER)
             except yaml.YAMLError as e:
                 error_msg = (
                     f"YAML parsing error in {path}: {e}\n"
@@ -165,14 +312,17 @@ def load_yaml(
                 logger.error(error_msg)
                 raise YAMLError(error_msg)
             
-            # Ensure version field exists
-            data = _ensure_version(data, path)
+            # Ensure version field exists; only fresh parses get here, so
+            # cached entries are never mutated
+            data.setdefault("version", SCHEMA_VERSION)
             
             # Validate schema if requested
-            if validate_schema and schema_path:
+            validated = bool(validate_schema and schema_path)
+            if validated:
                 _validate_schema(data, schema_path, path)
             
-            return data
+            _yaml_cache_put(path, cache_key, validated, data)
+            return copy.deepcopy(data)
         
         except (YAMLError, SchemaValidationError):
             raise
@@ -181,6 +331,14 @@ def load_yaml(
             logger.error(error_msg, exc_info=True)
             raise YAMLError(error_msg) from e
     
+    if use_lock == "optimistic":
+        try:
+            return _do_load()
+        except YAMLError:
+            # Possibly caught mid-write by a writer not using save_yaml();
+            # re-read under the lock below
+            logger.debug(f"Optimistic read of {path} failed, re-reading under lock")
+    
     # Retry logic
     if retry_on_error:
         for attempt in range(MAX_RETRIES):
@@ -192,13 +350,20 @@ def load_yaml(
                     return _do_load()
             except (YAMLError, SchemaValidationError):
                 raise  # Don't retry on validation errors
+            except LockError as e:
+                # FileLock already waited out its timeout; retrying would only
+                # multiply the wait
+                error_msg = f"Failed to load {path}: {e}"
+                logger.error(error_msg)
+                raise YAMLError(error_msg) from e
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    delay = _retry_delay(attempt)
                     logger.warning(
                         f"Error loading {path} (attempt {attempt + 1}/{MAX_RETRIES}): {e}. "
-                        f"Retrying in {RETRY_DELAY}s..."
+                        f"Retrying in {delay:.2f}s..."
                     )
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(delay)
                 else:
                     error_msg = f"Failed to load {path} after {MAX_RETRIES} attempts: {e}"
                     logger.error(error_msg)
@@ -213,6 +378,145 @@ def load_yaml(
     return default
 
 
+def _get_load_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by load_yaml_many(), creating it on first use."""
+    global _load_executor
+    with _load_executor_lock:
+        if _load_executor is None:
+            _load_executor = ThreadPoolExecutor(
+                max_workers=LOAD_MAX_WORKERS, thread_name_prefix="crewkan-load"
+            )
+        return _load_executor
+
+
+def load_yaml_many(paths: Iterable[Path], **load_kwargs) -> List[Any]:
+    """
+    Load several YAML files, overlapping their I/O on a thread pool.
+    
+    Batches smaller than PARALLEL_LOAD_THRESHOLD are loaded serially.
+    
+    Args:
+        paths: Files to load
+        **load_kwargs: Passed through to load_yaml()
+    
+    Returns:
+        Loaded data in the same order as paths
+    
+    Raises:
+        YAMLError: If a file is corrupted (the first one, in path order)
+    """
+    paths = list(paths)
+    if len(paths) < PARALLEL_LOAD_THRESHOLD:
+        return [load_yaml(path, **load_kwargs) for path in paths]
+    load = functools.partial(load_yaml, **load_kwargs)
+    return list(_get_load_executor().map(load, paths))
+
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read a whole file with raw os.read() calls, bypassing Python's buffered
+    text layer; a task file is normally read with one read() syscall.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # Ask for more than the size so one short read means end of file,
+        # even if the file grew since the fstat
+        want = max(os.fstat(fd).st_size + 1, 4096)
+        chunks = []
+        while True:
+            chunk = os.read(fd, want)
+            chunks.append(chunk)
+            if len(chunk) < want:
+                break
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def load_yaml_header(path: Path, body_keys=BODY_KEYS) -> Optional[Dict[str, Any]]:
+    """
+    Parse a task file without its bulky body sections.
+    
+    Top-level blocks whose key is in body_keys (description, history,
+    dependencies) are cut out of the text before parsing, so the parse cost
+    is bounded by the header size instead of the length of the history.
+    No schema validation or version handling is done.
+    
+    Args:
+        path: Path to YAML file
+        body_keys: Top-level keys to skip
+    
+    Returns:
+        The remaining top-level fields, or None if the file is missing or its
+        layout isn't the plain block mapping save_yaml() writes; callers
+        should fall back to load_yaml() in that case
+    """
+    try:
+        text = _read_bytes(path).decode("utf-8")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    
+    kept = []
+    skipping = False
+    for line in text.splitlines(keepends=True):
+        # Indented lines, "- " items of a compact block list, comments and
+        # blank lines all belong to the current top-level key
+        if line[0] in " \t#\r\n" or (line[0] == "-" and not line.startswith("---")):
+            if not skipping:
+                kept.append(line)
+            continue
+        match = _TOP_LEVEL_KEY.match(line)
+        if match is None:
+            return None
+        skipping = match.group(1) in body_keys
+        if not skipping:
+            kept.append(line)
+    
+    try:
+        data = yaml.load("".join(kept), Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# fdatasync skips flushing metadata we don't need; not every platform has it
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def dump_yaml(data: Any, stream) -> None:
+    """Write data as block-style YAML to an open text stream, keeping key order."""
+    yaml.dump(data, stream, Dumper=_YAML_DUMPER, sort_keys=False, default_flow_style=False)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry change (e.g. a rename) to disk where supported."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_backup(path: Path, backup_path: Path) -> None:
+    """
+    Make backup_path hold the current contents of path.
+    
+    A hard link costs no I/O and stays a snapshot because save_yaml() swaps a
+    new inode into path; where links aren't supported, fall back to a copy
+    (which shutil does in-kernel on Linux).
+    """
+    try:
+        backup_path.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
+
+
 def save_yaml(
     path: Path,
     data: dict,
@@ -220,6 +524,7 @@ def save_yaml(
     use_lock: bool = True,
     retry_on_error: bool = True,
     create_backup: bool = True,
+    fsync: bool = False,
 ) -> None:
     """
     Save data to YAML file with error handling, retry logic, and optional schema validation.
@@ -231,33 +536,21 @@ def save_yaml(
         use_lock: Whether to use file locking
         retry_on_error: Whether to retry on errors
         create_backup: Whether to create backup of existing file
+        fsync: Whether to flush the data and the rename to disk before
+            returning (slower, but survives a crash or power loss)
     
     Raises:
         SchemaValidationError: If schema validation fails
         YAMLError: If save operation fails
     """
-    # Ensure version field exists
-    data = _ensure_version(data, path)
-    
-    # Determine schema based on file path
-    schema_path = None
-    if "board.yaml" in str(path):
-        schema_path = BOARD_SCHEMA
-    elif "agents.yaml" in str(path):
-        schema_path = AGENTS_SCHEMA
-    elif path.parent.name in ["todo", "doing", "done", "backlog", "blocked"]:
-        # Check if in issues/ directory (new) or tasks/ directory (old)
-        if "issues" in str(path) or path.parent.parent.name == "issues":
-            schema_path = ISSUE_SCHEMA
-        else:
-            # Backwards compatibility: use TASK_SCHEMA for tasks/ directory
-            schema_path = TASK_SCHEMA
-    
-    # Validate schema before saving
-    if validate_schema and schema_path:
-        _validate_schema(data, schema_path, path)
+    # Ensure version field exists, then validate schema before saving
+    if validate_schema:
+        validate_yaml_data(path, data)
+    else:
+        data.setdefault("version", SCHEMA_VERSION)
     
-    lock = FileLock(path) if use_lock else None
+    # Board paths are built from a resolved root, so skip resolving again
+    lock = FileLock(path, resolve=False) if use_lock else None
     
     def _do_save():
         try:
@@ -265,8 +558,7 @@ def save_yaml(
             if create_backup and path.exists():
                 backup_path = path.with_suffix(path.suffix + ".bak")
                 try:
-                    import shutil
-                    shutil.copy2(path, backup_path)
+                    _write_backup(path, backup_path)
                     logger.debug(f"Created backup: {backup_path}")
                 except Exception as e:
                     logger.warning(f"Failed to create backup: {e}")
@@ -274,22 +566,32 @@ def save_yaml(
             # Ensure parent directory exists
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write to temporary file first, then rename (atomic operation)
-            temp_path = path.with_suffix(path.suffix + ".tmp")
+            # Write to temporary file first, then rename (atomic operation).
+            # The name is unique and O_EXCL, so concurrent writers (even ones
+            # not sharing the lock) never write into the same temp file;
+            # os.open honours the umask, unlike tempfile's 0600 files.
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp")
             try:
-                with temp_path.open("w", encoding="utf-8") as f:
-                    yaml.safe_dump(data, f, sort_keys=False, default_flow_style=False)
+                flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+                fd = os.open(temp_path, flags, 0o666)
+                with open(fd, "w", encoding="utf-8") as f:
+                    dump_yaml(data, f)
+                    if fsync:
+                        f.flush()
+                        _fdatasync(f.fileno())
                 
                 # Atomic rename
                 temp_path.replace(path)
+                if fsync:
+                    _fsync_dir(path.parent)
+                _yaml_cache_discard(path)
                 logger.debug(f"Saved {path}")
             except Exception as e:
                 # Clean up temp file on error
-                if temp_path.exists():
-                    try:
-                        temp_path.unlink()
-                    except Exception:
-                        pass
+                try:
+                    temp_path.unlink()
+                except OSError:
+                    pass
                 raise
             
         except Exception as e:
@@ -310,13 +612,20 @@ def save_yaml(
                     return
             except (SchemaValidationError, YAMLError):
                 raise  # Don't retry on validation errors
+            except LockError as e:
+                # FileLock already waited out its timeout; retrying would only
+                # multiply the wait
+                error_msg = f"Failed to save {path}: {e}"
+                logger.error(error_msg)
+                raise YAMLError(error_msg) from e
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    delay = _retry_delay(attempt)
                     logger.warning(
                         f"Error saving {path} (attempt {attempt + 1}/{MAX_RETRIES}): {e}. "
-                        f"Retrying in {RETRY_DELAY}s..."
+                        f"Retrying in {delay:.2f}s..."
                     )
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(delay)
                 else:
                     error_msg = f"Failed to save {path} after {MAX_RETRIES} attempts: {e}"
                     logger.error(error_msg)
@@ -329,17 +638,120 @@ def save_yaml(
             _do_save()
 
 
-def generate_task_id(prefix="T"):
+def move_yaml(path: Path, new_path: Path, data: dict, **save_kwargs) -> None:
+    """
+    Rewrite a YAML file in place, then atomically rename it to new_path.
+    
+    Unlike writing a copy at the destination and unlinking the source, there is
+    never a moment where both or neither file exists.
+    
+    Args:
+        path: Current location of the file
+        new_path: Destination (may equal path)
+        data: Updated data to save
+        **save_kwargs: Passed through to save_yaml()
+    """
+    if new_path != path:
+        # A backup would be left behind in the old location
+        save_kwargs.setdefault("create_backup", False)
+    save_yaml(path, data, **save_kwargs)
+    if new_path != path:
+        new_path.parent.mkdir(parents=True, exist_ok=True)
+        path.replace(new_path)
+        _yaml_cache_discard(path)
+
+
+def get_history_log_path(board_root: Path, task_id: str) -> Path:
+    """Get the path of a task's archived history log."""
+    return Path(board_root) / HISTORY_DIRNAME / f"{task_id}.jsonl"
+
+
+def append_history(
+    task: Dict[str, Any],
+    entry: Dict[str, Any],
+    board_root: Optional[Path] = None,
+    max_entries: int = HISTORY_MAX_ENTRIES,
+) -> None:
+    """
+    Append an entry to a task's history, keeping at most max_entries in the task.
+    
+    Older entries are appended to the task's JSONL history log under
+    board_root, so the YAML file (parsed on every load) stops growing. Without
+    a board_root nothing is archived and the history is left untrimmed.
+    
+    The log is written before the caller saves the task, so a failed save
+    can't lose entries; if it fails, the same entries are archived again on
+    the next append, and load_history() drops the repeats.
+    
+    Args:
+        task: Task/issue dict, modified in place
+        entry: History entry to append
+        board_root: Root directory of the board
+        max_entries: Number of entries to keep in the task file
+    """
+    history = task.setdefault("history", [])
+    history.append(entry)
+    if board_root is None or len(history) <= max_entries or not task.get("id"):
+        return
+    
+    overflow = history[:-max_entries]
+    log_path = get_history_log_path(board_root, task["id"])
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("a", encoding="utf-8") as f:
+        f.writelines(json.dumps(e, separators=(",", ":")) + "\n" for e in overflow)
+    task["history"] = history[-max_entries:]
+
+
+def load_history(board_root: Path, task: Dict[str, Any]) -> list:
+    """
+    Get a task's full history: archived log entries followed by the task's own.
+    
+    Entries archived more than once (see append_history()) are returned once.
+    
+    Args:
+        board_root: Root directory of the board
+        task: Task/issue dict
+    
+    Returns:
+        History entries, oldest first
+    """
+    history = list(task.get("history") or [])
+    if not task.get("id"):
+        return history
+    log_path = get_history_log_path(board_root, task["id"])
+    archived = []
+    try:
+        with log_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    archived.append(json.loads(line))
+                except ValueError:
+                    if line.strip():
+                        logger.warning(f"Skipping unreadable line in history log {log_path}")
+    except FileNotFoundError:
+        return history
+    
+    merged = []
+    seen = set()
+    for entry in archived + history:
+        key = json.dumps(entry, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            merged.append(entry)
+    return merged
+
+
+def generate_task_id(prefix="T", tm: Optional[time.struct_time] = None):
     """Generate a unique task ID with timestamp and random suffix.
     
     DEPRECATED: Use generate_issue_id() instead.
     Kept for backwards compatibility.
     """
-    return generate_issue_id(prefix)
+    return generate_issue_id(prefix, tm)
 
-def generate_issue_id(prefix="I"):
-    """Generate a unique issue ID with timestamp and random suffix."""
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-    suffix = uuid.uuid4().hex[:6]
+def generate_issue_id(prefix="I", tm: Optional[time.struct_time] = None):
+    """Generate a unique issue ID with timestamp (tm, or now) and random suffix."""
+    ts = time.strftime("%Y%m%d-%H%M%S", tm or time.gmtime())
+    suffix = os.urandom(3).hex()
     return f"{prefix}-{ts}-{suffix}"
 
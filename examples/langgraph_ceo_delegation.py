@@ -15,12 +15,16 @@ This demonstrates:
 import os
 import sys
 import argparse
+import functools
 import random
+import re
 from pathlib import Path
 from typing import Annotated, TypedDict
 import asyncio
 import json
 import time
+import weakref
+from dataclasses import dataclass
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -29,13 +33,14 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+import httpx
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
-from operator import add
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import AzureChatOpenAI
 
-from crewkan.board_core import BoardClient
+from crewkan.board_core import BoardClient, BoardError
 from crewkan.board_init import init_board
+from crewkan.utils import load_yaml
 from crewkan.board_langchain_tools import make_board_tools
 
 
@@ -43,9 +48,18 @@ from crewkan.board_langchain_tools import make_board_tools
 # State Definition
 # ============================================================================
 
+# Most recent messages kept in the graph state; older ones are dropped
+MESSAGE_WINDOW = 64
+
+
+def _windowed_add(old: list, new: list) -> list:
+    """Reducer that appends new messages but keeps only the last MESSAGE_WINDOW."""
+    return (old + new)[-MESSAGE_WINDOW:]
+
+
 class AgentState(TypedDict):
     """State shared between agents in the graph."""
-    messages: Annotated[list, add]  # Messages with reducer to handle concurrent updates
+    messages: Annotated[list, _windowed_add]  # Bounded reducer, safe for concurrent updates
     agent_id: str  # Current agent processing
     issue_id: str | None  # Current issue being worked on
     board_root: str  # Board directory
@@ -57,40 +71,491 @@ class AgentState(TypedDict):
 # Helper Functions
 # ============================================================================
 
-def get_priority_value(priority: str | None) -> int:
-    """Convert priority string to numeric value for sorting (higher = more important)."""
-    priority_map = {"high": 3, "medium": 2, "low": 1}
-    return priority_map.get(priority or "medium", 0)
+# Seconds of simulated work per issue. Set CREWKAN_SIM_SECONDS (e.g. to 0 for
+# tests and benchmarks) to replace the default random 2-5 seconds.
+_sim_seconds = os.environ.get("CREWKAN_SIM_SECONDS")
+SIM_SECONDS = float(_sim_seconds) if _sim_seconds else None
+
+# Most "doing" issues a worker completes concurrently in one step
+DOING_BATCH_SIZE = 8
+
+# Columns a worker polls each step, in the order it works through them
+WORKER_COLUMNS = ("doing", "todo", "backlog")
+
+# Values accepted from generated issues (see crewkan/schemas/issue_schema.yaml)
+ISSUE_PRIORITIES = frozenset(("high", "medium", "low"))
+ISSUE_TYPES = frozenset(("epic", "user_story", "task", "bug", "feature", "improvement"))
+
+# Azure OpenAI settings, read once when the module loads (after .env)
+AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
+AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
+AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
+AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+
+# HTTP/2 needs the optional h2 package; without it the pool speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One connection pool for every agent's chat model, so connections (and their
+# TLS handshakes) to the Azure endpoint are reused across agents. main()
+# opens it for the run and closes it on exit; models built while it is None
+# use their own default client.
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def new_shared_http_client() -> httpx.AsyncClient:
+    """Create the pooled client make_llm() hands to every chat model."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0),
+        timeout=30.0,
+        http2=HTTP2_AVAILABLE,
+    )
+
+# Seconds an agent trusts its list of active agents before re-reading the board
+AGENT_REFRESH_SECONDS = 30.0
+
+# Most issues the CEO generates in one step, and most LLM requests in flight
+# for one batch
+GENERATION_BATCH_SIZE = 4
+LLM_MAX_CONCURRENCY = 8
+
+
+def simulated_work_time() -> float:
+    """Seconds to sleep for one issue's simulated work."""
+    if SIM_SECONDS is not None:
+        return SIM_SECONDS
+    return random.uniform(2.0, 5.0)
+
+
+# Longest an idle agent sleeps before looking at the board again; it wakes
+# sooner when an agent in this process changes the board
+IDLE_WAIT_SECONDS = 1.0
+
+# One event per event loop; an asyncio.Event can only be awaited on one loop
+_board_changed: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Event]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def notify_board_changed() -> None:
+    """Wake every agent on this event loop waiting in wait_for_board_change()."""
+    try:
+        event = _board_changed.get(asyncio.get_running_loop())
+    except RuntimeError:  # Not called from a coroutine; nobody can be waiting
+        return
+    if event is not None:
+        # set() resolves the current waiters; clearing re-arms it for the next wait
+        event.set()
+        event.clear()
+
+
+async def wait_for_board_change(timeout: float = IDLE_WAIT_SECONDS) -> None:
+    """Wait until an issue is created or moved in this process, or timeout."""
+    loop = asyncio.get_running_loop()
+    event = _board_changed.get(loop)
+    if event is None:
+        event = _board_changed[loop] = asyncio.Event()
+    try:
+        await asyncio.wait_for(event.wait(), timeout=max(timeout, 0))
+    except asyncio.TimeoutError:
+        pass
+
+
+class _NotifyingBoardClient(BoardClient):
+    """
+    BoardClient that wakes idle agents whenever it changes the board, and
+    drops the board's cached column counts.
+    """
+    
+    def _changed(self) -> None:
+        _counts_cache.pop(self.root, None)
+        notify_board_changed()
+    
+    def create_issue(self, *args, **kwargs):
+        result = super().create_issue(*args, **kwargs)
+        self._changed()
+        return result
+    
+    def create_issues_bulk(self, *args, **kwargs):
+        result = super().create_issues_bulk(*args, **kwargs)
+        self._changed()
+        return result
+    
+    def move_issue(self, *args, **kwargs):
+        result = super().move_issue(*args, **kwargs)
+        self._changed()
+        return result
+    
+    def reassign_issue(self, *args, **kwargs):
+        result = super().reassign_issue(*args, **kwargs)
+        self._changed()
+        return result
+
+
+@functools.lru_cache(maxsize=16)
+def _client_for(board_root: str, agent_id: str) -> BoardClient:
+    """Get a shared client, so helpers called every step don't reload board.yaml."""
+    return _NotifyingBoardClient(board_root, agent_id)
+
+
+# Seconds cached column counts are trusted without looking at the board.
+# Clients from _client_for() drop the counts as soon as they change the
+# board; this only bounds how long changes made by other processes go unseen.
+COUNTS_MAX_AGE = 5.0
+
+# Resolved board root -> (time last checked, column directory fingerprint, counts)
+_counts_cache: dict[Path, tuple[float, tuple, dict[str, int]]] = {}
+
+# Seconds get_recent_issue_history() reuses its result
+HISTORY_MAX_AGE = 5.0
+
+# (resolved board root, limit) -> (time read, history JSON)
+_history_cache: dict[tuple[Path, int], tuple[float, str]] = {}
+
+
+def _column_dirs_signature(issues_root: Path) -> tuple:
+    """
+    Fingerprint the column directories by mtime. Creating, moving or deleting
+    an issue file changes its directory's mtime; edits inside a file don't,
+    but those can't change which column the issue is counted in.
+    """
+    try:
+        with os.scandir(issues_root) as entries:
+            return tuple(sorted(
+                (e.name, e.stat().st_mtime_ns) for e in entries if e.is_dir()
+            ))
+    except FileNotFoundError:
+        return ()
 
 
 def count_issues_by_status(board_root: str) -> dict[str, int]:
     """Count issues in each column."""
-    client = BoardClient(board_root, "ceo")  # Use CEO to count all issues
+    client = _client_for(board_root, "ceo")  # Use CEO to count all issues
+    now = time.monotonic()
+    cached = _counts_cache.get(client.root)
+    if cached is not None and now - cached[0] < COUNTS_MAX_AGE:
+        return dict(cached[2])
+    
+    signature = _column_dirs_signature(client.issues_root)
+    if cached is not None and cached[1] == signature:
+        _counts_cache[client.root] = (now, signature, cached[2])
+        return dict(cached[2])
+    
+    # An issue's column is the directory it is filed in, so count directory
+    # entries rather than parsing each file for its column field
     counts = {}
-    for path, issue in client.iter_issues():
-        column = issue.get("column", "unknown")
-        counts[column] = counts.get(column, 0) + 1
-    return counts
+    for column, _ in signature:
+        try:
+            with os.scandir(client.issues_root / column) as entries:
+                n = sum(1 for e in entries if e.name.endswith(".yaml") and e.is_file())
+        except FileNotFoundError:
+            continue
+        if n:
+            counts[column] = n
+    _counts_cache[client.root] = (now, signature, counts)
+    return dict(counts)
 
 
 def get_recent_issue_history(board_root: str, limit: int = 10) -> str:
-    """Get recent issue history for context in issue generation."""
-    client = BoardClient(board_root, "ceo")
-    history = []
+    """
+    Get recent issue history for context in issue generation.
+    
+    The result only feeds the generation prompt, so it is reused for
+    HISTORY_MAX_AGE seconds rather than re-read on every call.
+    """
+    client = _client_for(board_root, "ceo")
+    key = (client.root, limit)
+    now = time.monotonic()
+    cached = _history_cache.get(key)
+    if cached is not None and now - cached[0] < HISTORY_MAX_AGE:
+        return cached[1]
+    
+    # Only the done column matters; parse just its newest files
+    history = [
+        {
+            "title": issue.get("title", ""),
+            "assignee": issue.get("assignees", [""])[0] if issue.get("assignees") else "",
+            "priority": issue.get("priority", "medium"),
+            "issue_type": issue.get("issue_type", "task"),
+        }
+        for issue in client.list_recent("done", limit)
+    ]
     
-    # Get recent completed issues
-    for path, issue in client.iter_issues():
-        if issue.get("column") == "done":
-            history.append({
-                "title": issue.get("title", ""),
-                "assignee": issue.get("assignees", [""])[0] if issue.get("assignees") else "",
-                "priority": issue.get("priority", "medium"),
-                "issue_type": issue.get("issue_type", "task"),
-            })
-        if len(history) >= limit:
-            break
+    result = json.dumps(history, indent=2)
+    _history_cache[key] = (now, result)
+    return result
+
+
+def azure_configured() -> bool:
+    """Whether the Azure OpenAI settings needed by make_llm() are present."""
+    return bool(AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT and AZURE_OPENAI_DEPLOYMENT_NAME)
+
+
+def make_llm() -> AzureChatOpenAI:
+    """Create the chat model used for issue generation and comments."""
+    return AzureChatOpenAI(
+        azure_endpoint=AZURE_OPENAI_ENDPOINT,
+        azure_deployment=AZURE_OPENAI_DEPLOYMENT_NAME,
+        api_key=AZURE_OPENAI_API_KEY,
+        api_version=AZURE_OPENAI_API_VERSION,
+        temperature=0.7,
+        http_async_client=_shared_http_client,
+    )
+
+
+@dataclass
+class AgentContext:
+    """
+    Per-node state built once by a node factory.
+
+    The list of active agents is re-read from the board every
+    AGENT_REFRESH_SECONDS, so agents added or deactivated while the graph
+    runs are picked up without rebuilding it.
+    """
+    llm: AzureChatOpenAI | None
+    client: BoardClient
+    agent_ids: list[str]
+    agent_names: str  # "COO (role), CFO (role)" for prompts
+    last_refresh: float
+
+    @classmethod
+    def build(cls, board_root: str, agent_id: str, llm: AzureChatOpenAI | None) -> "AgentContext":
+        ctx = cls(llm, _client_for(board_root, agent_id), [], "", 0.0)
+        ctx.refresh()
+        return ctx
+
+    def refresh(self, now: float | None = None) -> None:
+        """Re-read the active agents from agents.yaml."""
+        # Reload the client's own agent index too, so it accepts new agents
+        # as assignees
+        self.client.reload_agents()
+        active = [a for a in self.client.list_agents() if a.get("status") != "inactive"]
+        self.agent_ids = [a["id"] for a in active]
+        self.agent_names = ", ".join(f"{a['id'].upper()} ({a.get('role', 'Agent')})" for a in active)
+        self.last_refresh = time.time() if now is None else now
+
+    def refresh_if_stale(self, now: float | None = None) -> None:
+        """Refresh the agent list if it is older than AGENT_REFRESH_SECONDS."""
+        now = time.time() if now is None else now
+        if now - self.last_refresh > AGENT_REFRESH_SECONDS:
+            self.refresh(now)
+
+
+# ============================================================================
+# Prompts
+# ============================================================================
+
+# Each prompt is a fixed system message plus a short user message with the
+# per-issue fields. Keeping the instructions first and byte-identical lets
+# Azure OpenAI reuse the cached prompt prefix across calls.
+
+COMPLETION_SYSTEM_PROMPT = """You are a {role} completing an issue. Generate a brief completion comment summarizing what was accomplished.
+
+You will be given the issue title, its description and any previous comments.
+Reply with the completion comment only (1-2 sentences)."""
+
+CLARIFICATION_SYSTEM_PROMPT = """You are a {role} requesting clarification on an issue. Generate a clarifying question.
+
+You will be given the issue title and its description.
+Reply with the clarifying question only (1-2 sentences)."""
+
+GENERATION_SYSTEM_PROMPT = """You are a CEO managing a team. You are the board owner, so you cannot assign issues upwards.
+You (CEO) can also assign issues to yourself.
+
+You will be given the available agents, recently completed issues and the current backlog size.
+
+Generate ONE new issue, considering what work would be most valuable based on recent completions
+and which agent (including 'ceo' for yourself) should handle it.
+
+Respond with a JSON object with the keys "title", "description" (brief), "assignee" (an agent id),
+"priority" (high, medium or low) and "issue_type" (epic, user_story, task, bug, feature or improvement)."""
+
+
+def completion_messages(role: str, issue: dict) -> list:
+    """Messages asking for a completion comment on issue."""
+    comments_text = "\n".join(
+        f"- {h.get('by', 'unknown')}: {h.get('details', '')}"
+        for h in issue.get("history", [])
+        if h.get("event") == "comment"
+    )
+    return [
+        SystemMessage(content=COMPLETION_SYSTEM_PROMPT.format(role=role)),
+        HumanMessage(content=(
+            f"Issue: {issue.get('title', '')}\n"
+            f"Description: {issue.get('description', '')}\n"
+            f"Previous comments:\n{comments_text or 'None'}"
+        )),
+    ]
+
+
+def clarification_messages(role: str, issue: dict) -> list:
+    """Messages asking for a clarifying question on issue."""
+    return [
+        SystemMessage(content=CLARIFICATION_SYSTEM_PROMPT.format(role=role)),
+        HumanMessage(content=(
+            f"Issue: {issue.get('title', '')}\n"
+            f"Description: {issue.get('description', '')}"
+        )),
+    ]
+
+
+def generation_messages(
+    agent_names: str, recent_history: str, backlog_count: int, max_backlog: int, suggested_assignee: str
+) -> list:
+    """Messages asking the CEO for one new issue as JSON."""
+    return [
+        SystemMessage(content=GENERATION_SYSTEM_PROMPT),
+        HumanMessage(content=(
+            f"Available agents: {agent_names}\n\n"
+            f"Recent completed issues:\n{recent_history}\n\n"
+            f"Current backlog size: {backlog_count}/{max_backlog}\n"
+            f"Suggested assignee: {suggested_assignee}"
+        )),
+    ]
+
+
+def parse_generated_issue(content: str, agent_ids: list[str]) -> dict:
+    """
+    Turn an issue-generation response into create_issue() keyword arguments.
+
+    Raises:
+        ValueError: If the response is not a JSON object with a title and
+            description
+    """
+    issue_data = json.loads(content)
+    if not isinstance(issue_data, dict):
+        raise ValueError("Generated issue is not a JSON object")
+    
+    title = issue_data.get("title")
+    description = issue_data.get("description")
+    for field, value in (("title", title), ("description", description)):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"Generated issue has no {field}")
+    
+    # Validate the fields, falling back to defaults
+    assignee = issue_data.get("assignee")
+    if assignee not in agent_ids:
+        assignee = random.choice(agent_ids)
+    
+    priority = issue_data.get("priority", "medium")
+    if priority not in ISSUE_PRIORITIES:
+        priority = "medium"
+    
+    issue_type = issue_data.get("issue_type", "task")
+    if issue_type not in ISSUE_TYPES:
+        issue_type = "task"
     
-    return json.dumps(history, indent=2)
+    return {
+        "title": title.strip(),
+        "description": description.strip(),
+        "column": "backlog",
+        "assignees": [assignee],
+        "priority": priority,
+        "issue_type": issue_type,
+        "requested_by": "ceo",
+    }
+
+
+# Message builders for each comment kind, called with (role, issue)
+COMMENT_MESSAGES = {
+    "completion": completion_messages,
+    "clarification": clarification_messages,
+}
+
+
+class CommentCache:
+    """
+    Reuse generated comments as templates for similar issues.
+
+    Completion and clarification comments differ between issues mostly in
+    the title and description they quote. A generated comment that quotes at
+    least one of them is stored with those fields replaced by placeholders,
+    keyed on (kind, role, issue_type, priority), and filled in locally for
+    the next matching issue. Comments that quote neither are specific to
+    their issue in ways a template can't capture, so they are not cached.
+    Each template serves at most reuse_limit issues before the LLM is asked
+    again, so comments don't all read the same.
+    """
+
+    SLOTS = ("title", "description")
+
+    def __init__(self, reuse_limit: int = 4) -> None:
+        self.reuse_limit = reuse_limit
+        self._templates: dict[tuple, list] = {}  # key -> [template, uses]
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(kind: str, role: str, issue: dict) -> tuple:
+        return (kind, role, issue.get("issue_type", "task"), issue.get("priority", "medium"))
+
+    def get(self, kind: str, role: str, issue: dict) -> str | None:
+        """Fill a cached template in for issue, or None on a miss."""
+        entry = self._templates.get(self._key(kind, role, issue))
+        if entry is None or entry[1] >= self.reuse_limit:
+            self.misses += 1
+            return None
+        entry[1] += 1
+        self.hits += 1
+        return entry[0].format_map({slot: issue.get(slot) or "" for slot in self.SLOTS})
+
+    def put(self, kind: str, role: str, issue: dict, text: str) -> None:
+        """Store text, generated for issue, as the template for similar issues."""
+        template = text.replace("{", "{{").replace("}", "}}")
+        slotted = False
+        for slot in self.SLOTS:
+            value = (issue.get(slot) or "").strip()
+            if value:
+                escaped = value.replace("{", "{{").replace("}", "}}")
+                pattern = r"(?<!\w)" + re.escape(escaped) + r"(?!\w)"
+                template, n = re.subn(pattern, "{" + slot + "}", template, flags=re.IGNORECASE)
+                slotted = slotted or n > 0
+        if slotted:
+            self._templates[self._key(kind, role, issue)] = [template, 0]
+
+
+# Shared by every agent in the process
+comment_cache = CommentCache()
+
+
+async def generate_comment(llm: AzureChatOpenAI, kind: str, role: str, issue: dict) -> str:
+    """Get a kind ("completion" or "clarification") comment for issue from the cache, or from llm."""
+    comment = comment_cache.get(kind, role, issue)
+    if comment is None:
+        comment = (await llm.ainvoke(COMMENT_MESSAGES[kind](role, issue))).content.strip()
+        comment_cache.put(kind, role, issue, comment)
+    return comment
+
+
+async def generate_comments(
+    llm: AzureChatOpenAI, kind: str, role: str, issues: list[dict], fallback: str
+) -> list[str]:
+    """
+    Get comments for several issues, sending all cache misses in one batch.
+
+    Args:
+        kind, role: As for generate_comment()
+        issues: Full issue dicts to comment on
+        fallback: Comment used for any issue whose request fails
+    """
+    comments = [comment_cache.get(kind, role, issue) for issue in issues]
+    misses = [i for i, comment in enumerate(comments) if comment is None]
+    if misses:
+        responses = await llm.abatch(
+            [COMMENT_MESSAGES[kind](role, issues[i]) for i in misses],
+            config={"max_concurrency": LLM_MAX_CONCURRENCY},
+            return_exceptions=True,
+        )
+        for i, response in zip(misses, responses):
+            if isinstance(response, Exception):
+                comments[i] = fallback
+            else:
+                comments[i] = response.content.strip()
+                comment_cache.put(kind, role, issues[i], comments[i])
+    return comments
 
 
 # ============================================================================
@@ -100,30 +565,16 @@ def get_recent_issue_history(board_root: str, limit: int = 10) -> str:
 def create_ceo_node(board_root: str):
     """Create CEO agent node that generates tasks dynamically using GenAI and also works on tasks."""
     
-    # Check for Azure OpenAI API key
-    api_key = os.getenv("AZURE_OPENAI_API_KEY")
-    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-    deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-    api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
-    
-    if not api_key or not endpoint or not deployment:
+    if not azure_configured():
         raise ValueError(
             "Azure OpenAI credentials not set. Required: "
             "AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_DEPLOYMENT_NAME"
         )
     
-    llm = AzureChatOpenAI(
-        azure_endpoint=endpoint,
-        azure_deployment=deployment,
-        api_key=api_key,
-        api_version=api_version,
-        temperature=0.7,
-    )
-    client = BoardClient(board_root, "ceo")
-    
-    # Get all agents dynamically (not hardcoded)
-    all_agents = client.list_agents()
-    agent_ids = [a["id"] for a in all_agents if a.get("status") != "inactive"]
+    ctx = AgentContext.build(board_root, "ceo", make_llm())
+    llm, client = ctx.llm, ctx.client
+    # Issue generation uses JSON mode, so responses parse without unwrapping
+    issue_llm = llm.bind(response_format={"type": "json_object"})
     # CEO can assign to itself or others, but knows it's the board owner
     is_owner = client.is_board_owner()
     
@@ -133,13 +584,13 @@ def create_ceo_node(board_root: str):
         """CEO agent: Generates issues dynamically using GenAI, works on issues, and handles clarifications."""
         last_gen_time = state.get("last_issue_gen_time", 0.0)
         current_time = time.time()
+        ctx.refresh_if_stale(current_time)
         
         # First, CEO also works on issues (like other workers)
         # Priority order: 1) Complete issues in "doing", 2) Start issues from "todo", 3) Move from "backlog" to "todo"
         
         # Step 1: Check if there's an issue in "doing" - if so, complete it (highest priority)
-        doing_issues_json = client.list_my_issues(column="doing", limit=1)
-        doing_issues = json.loads(doing_issues_json)
+        doing_issues = await asyncio.to_thread(client.list_my_issues_objs, column="doing", limit=1)
         
         if doing_issues:
             issue = doing_issues[0]
@@ -147,33 +598,17 @@ def create_ceo_node(board_root: str):
             # Get full issue details for GenAI comment generation
             issue_details = client.get_issue_details(issue_id)
             
-            # Generate completion comment using GenAI
-            comments_text = "\n".join([
-                f"- {h.get('by', 'unknown')}: {h.get('details', '')}"
-                for h in issue_details.get("history", [])
-                if h.get("event") == "comment"
-            ])
-            
-            completion_prompt = f"""You are a CEO completing an issue. Generate a brief completion comment summarizing what was accomplished.
-
-Issue: {issue_details.get('title', '')}
-Description: {issue_details.get('description', '')}
-Previous comments:
-{comments_text if comments_text else 'None'}
-
-Generate a brief completion comment (1-2 sentences):"""
-            
             try:
-                response = llm.invoke(completion_prompt)
-                completion_comment = response.content.strip()
+                completion_comment = await generate_comment(
+                    llm, "completion", "CEO", issue_details
+                )
                 client.add_comment(issue_id, completion_comment)
             except Exception as e:
                 completion_comment = "Issue completed successfully."
                 client.add_comment(issue_id, completion_comment)
             
-            # Simulate work (random 2-5 seconds)
-            work_time = random.uniform(2.0, 5.0)
-            await asyncio.sleep(work_time)
+            # Simulate work
+            await asyncio.sleep(simulated_work_time())
             # Move to done
             client.move_issue(issue_id, "done", notify_on_completion=True)
             return {
@@ -184,12 +619,10 @@ Generate a brief completion comment (1-2 sentences):"""
             }
         
         # Step 2: Pick highest priority issue from todo and move to doing
-        todo_issues_json = client.list_my_issues(column="todo", limit=10)
-        todo_issues = json.loads(todo_issues_json)
+        # The client ranks the whole column by priority (high > medium > low)
+        todo_issues = await asyncio.to_thread(client.list_my_issues_objs, column="todo", limit=1, order_by="priority")
         
         if todo_issues:
-            # Sort by priority (high > medium > low)
-            todo_issues.sort(key=lambda t: get_priority_value(t.get("priority")), reverse=True)
             issue = todo_issues[0]
             issue_id = issue["id"]
             
@@ -200,23 +633,17 @@ Generate a brief completion comment (1-2 sentences):"""
                 
                 # CEO is board owner, so it cannot assign upwards
                 # Instead, add clarifying comment and reassign back to requestor (or keep if no requestor)
-                clarification_prompt = f"""You are a CEO (board owner) requesting clarification on an issue. Generate a clarifying question.
-
-Issue: {issue_details.get('title', '')}
-Description: {issue_details.get('description', '')}
-
-Generate a brief clarifying question (1-2 sentences):"""
-                
                 try:
-                    response = llm.invoke(clarification_prompt)
-                    clarification = response.content.strip()
+                    clarification = await generate_comment(
+                        llm, "clarification", "CEO (board owner)", issue_details
+                    )
                 except Exception as e:
                     clarification = "Need clarification on this issue. Please provide more details."
                 
                 client.add_comment(issue_id, f"Clarification needed: {clarification}")
                 
                 # Reassign to requestor if available, otherwise keep in backlog
-                if requested_by and requested_by in agent_ids and requested_by != "ceo":
+                if requested_by and requested_by in ctx.agent_ids and requested_by != "ceo":
                     client.reassign_issue(issue_id, requested_by, keep_existing=False)
                     client.move_issue(issue_id, "backlog", notify_on_completion=False)
                     return {
@@ -245,8 +672,7 @@ Generate a brief clarifying question (1-2 sentences):"""
             }
         
         # Step 3: Move issues from backlog to todo (if any)
-        backlog_issues_json = client.list_my_issues(column="backlog", limit=10)
-        backlog_issues = json.loads(backlog_issues_json)
+        backlog_issues = await asyncio.to_thread(client.list_my_issues_objs, column="backlog", limit=10)
         
         if backlog_issues:
             # Move first issue from backlog to todo
@@ -263,7 +689,8 @@ Generate a brief clarifying question (1-2 sentences):"""
         # Step 4: Generate new issues (if backlog not full)
         # Check if we should generate a new issue (every ~1 second)
         if current_time - last_gen_time < 1.0:
-            # Too soon, just wait
+            # Too soon; wait out the interval unless a worker hands us work first
+            await wait_for_board_change(1.0 - (current_time - last_gen_time))
             return {
                 "messages": [{
                     "role": "assistant",
@@ -274,10 +701,11 @@ Generate a brief clarifying question (1-2 sentences):"""
         # Check backlog size - only generate if backlog < agents X max_backlog_per_agent
         counts = count_issues_by_status(board_root)
         backlog_count = counts.get("backlog", 0)
-        max_backlog = len(agent_ids) * max_backlog_per_agent
+        max_backlog = len(ctx.agent_ids) * max_backlog_per_agent
         
         if backlog_count >= max_backlog:
-            # Backlog is full, don't generate more
+            # Backlog is full, don't generate more until something moves
+            await wait_for_board_change()
             return {
                 "last_issue_gen_time": current_time,
                 "messages": [{
@@ -289,76 +717,41 @@ Generate a brief clarifying question (1-2 sentences):"""
         # Get recent issue history for context
         recent_history = get_recent_issue_history(board_root, limit=5)
         
-        # Generate a new issue using GenAI
-        agent_names = ", ".join([f"{a['id'].upper()} ({a.get('role', 'Agent')})" for a in all_agents if a.get("status") != "inactive"])
-        prompt = f"""You are a CEO managing a team. You are the board owner, so you cannot assign issues upwards.
-
-Available agents: {agent_names}
-You (CEO) can also assign issues to yourself.
-
-Recent completed issues:
-{recent_history}
-
-Current backlog size: {backlog_count}/{max_backlog}
-
-Generate ONE new issue. Consider:
-1. What work would be most valuable based on recent completions?
-2. Which agent (including 'ceo' for yourself) should handle this?
-3. What priority (high, medium, low) is appropriate?
-4. What issue type (epic, user_story, task, bug, feature, improvement) is appropriate?
-
-Respond in JSON format:
-{{
-    "title": "Issue title",
-    "description": "Brief issue description",
-    "assignee": "agent_id",
-    "priority": "high|medium|low",
-    "issue_type": "epic|user_story|task|bug|feature|improvement"
-}}"""
-
-        try:
-            response = llm.invoke(prompt)
-            content = response.content.strip()
-            
-            # Parse JSON from response (may have markdown code blocks)
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            issue_data = json.loads(content)
-            
-            # Validate and create issue
-            assignee = issue_data.get("assignee", random.choice(agent_ids))
-            if assignee not in agent_ids:
-                assignee = random.choice(agent_ids)
-            
-            priority = issue_data.get("priority", "medium")
-            if priority not in ["high", "medium", "low"]:
-                priority = "medium"
-            
-            issue_type = issue_data.get("issue_type", "task")
-            if issue_type not in ["epic", "user_story", "task", "bug", "feature", "improvement"]:
-                issue_type = "task"
-            
-            issue_id = client.create_issue(
-                title=issue_data.get("title", "Generated issue"),
-                description=issue_data.get("description", ""),
-                column="backlog",
-                assignees=[assignee],
-                priority=priority,
-                issue_type=issue_type,
-                requested_by="ceo",
+        # Generate up to GENERATION_BATCH_SIZE issues, as far as the backlog
+        # has room. The requests run concurrently, so a batch takes about as
+        # long as a single issue. Suggested assignees rotate through the team
+        # so the batch doesn't pile onto one agent.
+        batch_size = min(GENERATION_BATCH_SIZE, max_backlog - backlog_count)
+        start = random.randrange(len(ctx.agent_ids))
+        batch = [
+            generation_messages(
+                ctx.agent_names, recent_history, backlog_count, max_backlog,
+                ctx.agent_ids[(start + n) % len(ctx.agent_ids)],
             )
-            
-            return {
-                "last_issue_gen_time": current_time,
-                "messages": [{
-                    "role": "assistant",
-                    "content": f"CEO: Generated issue {issue_id} for {assignee.upper()} - {issue_data.get('title', '')} (type: {issue_type}, priority: {priority})"
-                }]
-            }
-        except Exception as e:
+            for n in range(batch_size)
+        ]
+        responses = await issue_llm.abatch(
+            batch, config={"max_concurrency": LLM_MAX_CONCURRENCY}, return_exceptions=True
+        )
+        
+        specs = []
+        for response in responses:
+            if isinstance(response, Exception):
+                continue
+            try:
+                specs.append(parse_generated_issue(response.content, ctx.agent_ids))
+            except ValueError:
+                continue
+        
+        issue_ids = []
+        if specs:
+            try:
+                issue_ids = client.create_issues_bulk(specs)
+            except BoardError:
+                # E.g. an assignee deactivated since the agent list was read
+                pass
+        
+        if not issue_ids:
             # If generation fails, just update timestamp and continue
             return {
                 "last_issue_gen_time": current_time,
@@ -367,6 +760,17 @@ Respond in JSON format:
                     "content": f"CEO: Issue generation failed, will retry later"
                 }]
             }
+        
+        return {
+            "last_issue_gen_time": current_time,
+            "messages": [
+                {
+                    "role": "assistant",
+                    "content": f"CEO: Generated issue {issue_id} for {spec['assignees'][0].upper()} - {spec['title']} (type: {spec['issue_type']}, priority: {spec['priority']})"
+                }
+                for issue_id, spec in zip(issue_ids, specs)
+            ]
+        }
     
     return ceo_agent
 
@@ -378,30 +782,32 @@ def create_worker_node(board_root: str, worker_id: str):
     Workers can request clarification (1 in 5 chance) and generate GenAI comments on completion.
     """
     
-    # Check for Azure OpenAI API key for GenAI comment generation
-    api_key = os.getenv("AZURE_OPENAI_API_KEY")
-    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-    deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-    api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
-    
+    # GenAI comments are optional; fall back to simple comments without an LLM
     llm = None
-    if api_key and endpoint and deployment:
+    if azure_configured():
         try:
-            llm = AzureChatOpenAI(
-                azure_endpoint=endpoint,
-                azure_deployment=deployment,
-                api_key=api_key,
-                api_version=api_version,
-                temperature=0.7,
-            )
+            llm = make_llm()
         except Exception:
-            llm = None  # Fall back to simple comments if LLM fails
+            llm = None
     
-    client = BoardClient(board_root, worker_id)
+    # Active agents, for reassignment
+    ctx = AgentContext.build(board_root, worker_id, llm)
+    client = ctx.client
+    worker_upper = worker_id.upper()  # Message prefix
     
-    # Get all agents for reassignment
-    all_agents = client.list_agents()
-    agent_ids = [a["id"] for a in all_agents if a.get("status") != "inactive"]
+    async def complete_issue(issue: dict, completion_comment: str) -> dict:
+        """Comment on an issue, simulate the work and move it to done."""
+        issue_id = issue["id"]
+        client.add_comment(issue_id, completion_comment)
+        
+        # Simulate work
+        await asyncio.sleep(simulated_work_time())
+        # Move to done
+        client.move_issue(issue_id, "done", notify_on_completion=True)
+        return {
+            "role": "assistant",
+            "content": f"{worker_upper}: Completed issue {issue_id} ({issue.get('title', '')}) and moved to done"
+        }
     
     async def worker_agent(state: AgentState):
         """Worker agent: Continuously processes issues from backlog→todo→doing→done."""
@@ -409,64 +815,35 @@ def create_worker_node(board_root: str, worker_id: str):
         
         # Priority order: 1) Complete issues in "doing", 2) Start issues from "todo", 3) Move from "backlog" to "todo"
         
-        # Step 1: Check if there's an issue in "doing" - if so, complete it (highest priority)
-        doing_issues_json = client.list_my_issues(column="doing", limit=1)
-        doing_issues = json.loads(doing_issues_json)
+        # One pass over the three columns; each is ranked by priority
+        # (high > medium > low)
+        buckets = await asyncio.to_thread(
+            client.list_my_issues_by_columns, WORKER_COLUMNS, DOING_BATCH_SIZE, "priority"
+        )
+        
+        # Step 1: Complete any issues in "doing" (highest priority), all at once
+        doing_issues = buckets["doing"]
         
         if doing_issues:
-            issue = doing_issues[0]
-            issue_id = issue["id"]
-            
-            # Get full issue details for GenAI comment generation
-            issue_details = client.get_issue_details(issue_id)
-            
-            # Generate completion comment using GenAI
-            comments_text = "\n".join([
-                f"- {h.get('by', 'unknown')}: {h.get('details', '')}"
-                for h in issue_details.get("history", [])
-                if h.get("event") == "comment"
-            ])
-            
-            completion_comment = None
+            # Get full issue details for GenAI comment generation, and ask for
+            # all the completion comments in one batch
+            details = [client.get_issue_details(issue["id"]) for issue in doing_issues]
+            fallback = "Issue completed successfully."
             if llm:
-                try:
-                    completion_prompt = f"""You are a worker completing an issue. Generate a brief completion comment summarizing what was accomplished.
-
-Issue: {issue_details.get('title', '')}
-Description: {issue_details.get('description', '')}
-Previous comments:
-{comments_text if comments_text else 'None'}
-
-Generate a brief completion comment (1-2 sentences):"""
-                    
-                    response = llm.invoke(completion_prompt)
-                    completion_comment = response.content.strip()
-                except Exception:
-                    completion_comment = "Issue completed successfully."
+                comments = await generate_comments(
+                    llm, "completion", "worker", details, fallback
+                )
             else:
-                completion_comment = "Issue completed successfully."
-            
-            client.add_comment(issue_id, completion_comment)
-            
-            # Simulate work (random 2-5 seconds)
-            work_time = random.uniform(2.0, 5.0)
-            await asyncio.sleep(work_time)
-            # Move to done
-            client.move_issue(issue_id, "done", notify_on_completion=True)
-            return {
-                "messages": [{
-                    "role": "assistant",
-                    "content": f"{worker_id.upper()}: Completed issue {issue_id} ({issue.get('title', '')}) and moved to done"
-                }]
-            }
+                comments = [fallback] * len(details)
+            completed = await asyncio.gather(*(
+                complete_issue(issue, comment) for issue, comment in zip(doing_issues, comments)
+            ))
+            return {"messages": list(completed)}
         
         # Step 2: Pick highest priority issue from todo and move to doing
-        todo_issues_json = client.list_my_issues(column="todo", limit=10)
-        todo_issues = json.loads(todo_issues_json)
+        todo_issues = buckets["todo"]
         
         if todo_issues:
-            # Sort by priority (high > medium > low)
-            todo_issues.sort(key=lambda t: get_priority_value(t.get("priority")), reverse=True)
             issue = todo_issues[0]
             issue_id = issue["id"]
             
@@ -474,20 +851,15 @@ Generate a brief completion comment (1-2 sentences):"""
             if random.random() < 0.2:  # 20% chance
                 issue_details = client.get_issue_details(issue_id)
                 requested_by = issue_details.get("requested_by")
+                ctx.refresh_if_stale()
                 
                 # Generate clarification request using GenAI
                 clarification = None
                 if llm:
                     try:
-                        clarification_prompt = f"""You are a worker requesting clarification on an issue. Generate a clarifying question.
-
-Issue: {issue_details.get('title', '')}
-Description: {issue_details.get('description', '')}
-
-Generate a brief clarifying question (1-2 sentences):"""
-                        
-                        response = llm.invoke(clarification_prompt)
-                        clarification = response.content.strip()
+                        clarification = await generate_comment(
+                            llm, "clarification", "worker", issue_details
+                        )
                     except Exception:
                         clarification = "Need clarification on this issue. Please provide more details."
                 else:
@@ -496,13 +868,13 @@ Generate a brief clarifying question (1-2 sentences):"""
                 client.add_comment(issue_id, f"Clarification needed: {clarification}")
                 
                 # Reassign to requestor if available, otherwise keep in backlog
-                if requested_by and requested_by in agent_ids:
+                if requested_by and requested_by in ctx.agent_ids:
                     client.reassign_issue(issue_id, requested_by, keep_existing=False)
                     client.move_issue(issue_id, "backlog", notify_on_completion=False)
                     return {
                         "messages": [{
                             "role": "assistant",
-                            "content": f"{worker_id.upper()}: Requested clarification on issue {issue_id} and reassigned to {requested_by}"
+                            "content": f"{worker_upper}: Requested clarification on issue {issue_id} and reassigned to {requested_by}"
                         }]
                     }
                 else:
@@ -511,7 +883,7 @@ Generate a brief clarifying question (1-2 sentences):"""
                     return {
                         "messages": [{
                             "role": "assistant",
-                            "content": f"{worker_id.upper()}: Requested clarification on issue {issue_id} and moved back to backlog"
+                            "content": f"{worker_upper}: Requested clarification on issue {issue_id} and moved back to backlog"
                         }]
                     }
             
@@ -520,37 +892,54 @@ Generate a brief clarifying question (1-2 sentences):"""
             return {
                 "messages": [{
                     "role": "assistant",
-                    "content": f"{worker_id.upper()}: Started working on issue {issue_id} ({issue.get('title', '')}) - priority: {issue.get('priority', 'medium')}"
+                    "content": f"{worker_upper}: Started working on issue {issue_id} ({issue.get('title', '')}) - priority: {issue.get('priority', 'medium')}"
                 }]
             }
         
         # Step 3: Move issues from backlog to todo (if any)
-        backlog_issues_json = client.list_my_issues(column="backlog", limit=10)
-        backlog_issues = json.loads(backlog_issues_json)
+        backlog_issues = buckets["backlog"]
         
         if backlog_issues:
-            # Move first issue from backlog to todo
+            # Move the top backlog issue to todo
             issue = backlog_issues[0]
             issue_id = issue["id"]
             client.move_issue(issue_id, "todo", notify_on_completion=False)
             return {
                 "messages": [{
                     "role": "assistant",
-                    "content": f"{worker_id.upper()}: Moved issue {issue_id} from backlog to todo"
+                    "content": f"{worker_upper}: Moved issue {issue_id} from backlog to todo"
                 }]
             }
         
-        # No issues to process
+        # No issues to process; sleep until the board changes
+        await wait_for_board_change()
         return {
             "messages": [{
                 "role": "assistant",
-                "content": f"{worker_id.upper()}: No issues to process. Waiting..."
+                "content": f"{worker_upper}: No issues to process. Waiting..."
             }]
         }
     
     return worker_agent
 
 
+def create_workers_node(board_root: str, worker_ids: tuple[str, ...] = ("coo", "cfo", "cto")):
+    """
+    Create one node that steps every worker agent concurrently.
+    
+    The workers share nothing but the board on disk, so running them under a
+    single asyncio.gather costs one state update per step instead of one per
+    worker.
+    """
+    workers = [create_worker_node(board_root, worker_id) for worker_id in worker_ids]
+    
+    async def workers_node(state: AgentState):
+        results = await asyncio.gather(*(worker(state) for worker in workers))
+        return {"messages": [msg for result in results for msg in result.get("messages", [])]}
+    
+    return workers_node
+
+
 
 
 def should_continue_worker(state: AgentState) -> str:
@@ -588,34 +977,27 @@ def create_delegation_graph(board_root: str):
     
     graph = StateGraph(AgentState)
     
-    # Add nodes - all agents run independently
+    # Add nodes - the CEO, and the workers (COO, CFO, CTO) stepped together
     coordinator_node = create_coordinator_node()
     ceo_node = create_ceo_node(board_root)
-    coo_node = create_worker_node(board_root, "coo")
-    cfo_node = create_worker_node(board_root, "cfo")
-    cto_node = create_worker_node(board_root, "cto")
+    workers_node = create_workers_node(board_root)
     
     graph.add_node("coordinator", coordinator_node)
     graph.add_node("ceo", ceo_node)
-    graph.add_node("coo", coo_node)
-    graph.add_node("cfo", cfo_node)
-    graph.add_node("cto", cto_node)
+    graph.add_node("workers", workers_node)
     
-    # Start with coordinator that routes to all agents in parallel
+    # Start with coordinator that routes to the CEO and workers in parallel
     graph.set_entry_point("coordinator")
     graph.add_edge("coordinator", "ceo")
-    graph.add_edge("coordinator", "coo")
-    graph.add_edge("coordinator", "cfo")
-    graph.add_edge("coordinator", "cto")
+    graph.add_edge("coordinator", "workers")
     
-    # Each agent loops back to itself to continue processing
-    # They all run independently in parallel
+    # Each node loops back to itself to continue processing
     graph.add_conditional_edges("ceo", should_continue_ceo, {"continue": "ceo", "end": END})
-    graph.add_conditional_edges("coo", should_continue_worker, {"continue": "coo", "end": END})
-    graph.add_conditional_edges("cfo", should_continue_worker, {"continue": "cfo", "end": END})
-    graph.add_conditional_edges("cto", should_continue_worker, {"continue": "cto", "end": END})
+    graph.add_conditional_edges("workers", should_continue_worker, {"continue": "workers", "end": END})
     
-    return graph.compile(checkpointer=MemorySaver(), interrupt_before=[], interrupt_after=[])
+    # No checkpointer: work resumes from the board on disk, not from saved graph
+    # state, and checkpointing would re-serialize the whole state every step
+    return graph.compile(interrupt_before=[], interrupt_after=[])
 
 
 # ============================================================================
@@ -624,6 +1006,7 @@ def create_delegation_graph(board_root: str):
 
 async def main():
     """Run the CEO delegation example with continuous task processing."""
+    global _shared_http_client
     
     # Setup board - don't reset, support work resumption
     board_root = Path("examples/ceo_delegation_board")
@@ -654,7 +1037,6 @@ async def main():
         ]
         
         # Check existing agents to avoid duplicates
-        from crewkan.utils import load_yaml
         agents_path = board_root / "agents" / "agents.yaml"
         if agents_path.exists():
             agents_data = load_yaml(agents_path, default={"agents": []})
@@ -667,9 +1049,6 @@ async def main():
                 args = Args(root=str(board_root), id=agent_id, name=name, role=role, kind="ai")
             cmd_add_agent(args)
     
-    # Create and run graph - all agents run independently
-    graph = create_delegation_graph(str(board_root))
-    
     initial_state = {
         "messages": [{"role": "user", "content": "Start continuous issue processing workflow"}],
         "agent_id": "system",
@@ -680,9 +1059,6 @@ async def main():
     }
     
     config = {
-        "configurable": {
-            "thread_id": "1",
-        },
         "recursion_limit": 10000  # Higher limit for long-running workflow
     }
     
@@ -696,22 +1072,33 @@ async def main():
     print("=" * 60)
     
     iteration = 0
-    async for event in graph.astream(initial_state, config, recursion_limit=1000):
-        iteration += 1
-        node_name = list(event.keys())[0]
-        state = event[node_name]
-        
-        # Print relevant messages
-        if state and "messages" in state and state["messages"]:
-            last_msg = state["messages"][-1] if isinstance(state["messages"], list) else {}
-            content = last_msg.get("content", "") if isinstance(last_msg, dict) else ""
-            if content:
-                print(f"\n[{node_name.upper()}] {content}")
-        
-        # Show progress periodically
-        if iteration % 5 == 0:
-            counts = count_issues_by_status(str(board_root))
-            print(f"\n📊 Progress: {counts}")
+    last_counts = None
+    # Create and run graph - all agents run independently, sharing one
+    # connection pool for their LLM calls
+    _shared_http_client = new_shared_http_client()
+    try:
+        graph = create_delegation_graph(str(board_root))
+        async for event in graph.astream(initial_state, config, recursion_limit=1000):
+            iteration += 1
+            node_name = next(iter(event))
+            state = event[node_name]
+            
+            # Print relevant messages (the workers node reports one per worker)
+            for msg in (state.get("messages") or ()) if state else ():
+                content = msg.get("content", "") if isinstance(msg, dict) else ""
+                if content:
+                    print(f"\n[{node_name.upper()}] {content}")
+            
+            # Show progress periodically. The counts come from directory listings
+            # (cached until a column changes), so this never parses issue files.
+            if iteration % 5 == 0:
+                counts = count_issues_by_status(str(board_root))
+                if counts != last_counts:
+                    print(f"\n📊 Progress: {counts}")
+                    last_counts = counts
+    finally:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
     
     # Final status
     print("\n" + "=" * 60)
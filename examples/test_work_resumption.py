@@ -24,16 +24,26 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
-from crewkan.board_core import BoardClient
+from crewkan import board_index
 
 
 def count_tasks_by_status(board_root: str) -> dict[str, int]:
     """Count tasks in each column."""
-    client = BoardClient(board_root, "ceo")
+    # A task's column is the directory it lives in, so no file needs parsing
     counts = {}
-    for path, task in client.iter_tasks():
-        column = task.get("column", "unknown")
-        counts[column] = counts.get(column, 0) + 1
+    for dir_name in board_index.TASK_DIRS:
+        try:
+            columns = os.scandir(os.path.join(board_root, dir_name))
+        except FileNotFoundError:
+            continue
+        with columns:
+            for column in columns:
+                if not column.is_dir():
+                    continue
+                with os.scandir(column.path) as entries:
+                    n = sum(1 for e in entries if e.name.endswith(".yaml") and e.is_file())
+                if n:
+                    counts[column.name] = counts.get(column.name, 0) + n
     return counts
 
 
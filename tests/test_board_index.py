@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test the persistent board index (crewkan/board_index.py).
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crewkan.board_init import init_board
+from crewkan.board_core import BoardClient
+from crewkan import board_index
+from crewkan.utils import load_yaml, load_yaml_header, save_yaml
+
+
+def test_index_built_and_reused():
+    """Test that the index is written once and unchanged files are not re-parsed."""
+    temp_dir = Path(tempfile.mkdtemp())
+    board_dir = temp_dir / "index_board"
+
+    try:
+        init_board(board_dir, "test", "Test Board", "test-agent", "test-agent")
+        client = BoardClient(board_dir, "test-agent")
+        issue_id = client.create_issue("Indexed", "Long description", "todo", ["test-agent"])
+
+        tasks = board_index.load_index(board_dir)
+        assert board_index.get_index_path(board_dir).exists()
+        path, summary = tasks[issue_id]
+        assert path.exists()
+        assert summary["title"] == "Indexed"
+        assert summary["column"] == "todo"
+        assert "description" not in summary
+
+        # A second load must come entirely from the index file
+        original_load_yaml = board_index.load_yaml
+        board_index.load_yaml = lambda *a, **k: pytest.fail("unchanged file was re-parsed")
+        try:
+            assert board_index.load_index(board_dir) == tasks
+        finally:
+            board_index.load_yaml = original_load_yaml
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_index_picks_up_edits_and_deletions():
+    """Test that edited, added and deleted task files are reflected."""
+    temp_dir = Path(tempfile.mkdtemp())
+    board_dir = temp_dir / "index_edits"
+
+    try:
+        init_board(board_dir, "test", "Test Board", "test-agent", "test-agent")
+        client = BoardClient(board_dir, "test-agent")
+        first = client.create_issue("First", "", "todo", ["test-agent"])
+        second = client.create_issue("Second", "", "todo", ["test-agent"])
+        tasks = board_index.load_index(board_dir)
+
+        # Edit one file behind the index's back
+        path = tasks[first][0]
+        data = load_yaml(path)
+        data["title"] = "First (edited)"
+        save_yaml(path, data)
+
+        # Delete the other
+        tasks[second][0].unlink()
+
+        tasks = board_index.load_index(board_dir)
+        assert tasks[first][1]["title"] == "First (edited)"
+        assert second not in tasks
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_corrupt_index_is_rebuilt():
+    """Test that an unreadable index file is ignored and rewritten."""
+    temp_dir = Path(tempfile.mkdtemp())
+    board_dir = temp_dir / "index_corrupt"
+
+    try:
+        init_board(board_dir, "test", "Test Board", "test-agent", "test-agent")
+        client = BoardClient(board_dir, "test-agent")
+        issue_id = client.create_issue("Survivor", "", "doing", ["test-agent"])
+
+        index_path = board_index.get_index_path(board_dir)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text("{not json", encoding="utf-8")
+
+        tasks = board_index.load_index(board_dir)
+        assert tasks[issue_id][1]["column"] == "doing"
+        assert board_index.load_index(board_dir) == tasks
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_load_yaml_header_skips_body():
+    """Test that header parsing drops body sections but keeps later fields."""
+    temp_dir = Path(tempfile.mkdtemp())
+    test_file = temp_dir / "task.yaml"
+
+    try:
+        data = {
+            "id": "I-1",
+            "title": "Header",
+            "description": "first line\n\nkey: not a field\n- not an item",
+            "column": "todo",
+            "history": [{"at": "2025-01-01T00:00:00Z", "by": "a", "event": "created", "details": "x\ny"}],
+            "priority": "high",
+            "version": 1,
+        }
+        save_yaml(test_file, data, validate_schema=False)
+
+        header = load_yaml_header(test_file)
+        assert header == {"id": "I-1", "title": "Header", "column": "todo", "priority": "high", "version": 1}
+
+        # Layouts it can't split safely are left to a full load
+        test_file.write_text("{id: I-1, title: Flow}\n", encoding="utf-8")
+        assert load_yaml_header(test_file) is None
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
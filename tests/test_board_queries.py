@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test BoardClient issue queries.
+"""
+
+import sys
+import json
+import time
+import tempfile
+import shutil
+from pathlib import Path
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crewkan.board_init import init_board
+from crewkan.board_core import BoardClient, BoardError
+
+
+@pytest.fixture
+def client():
+    """A client on a fresh board with a single agent."""
+    temp_dir = Path(tempfile.mkdtemp())
+    board_dir = temp_dir / "query_board"
+    init_board(board_dir, "test", "Test Board", "test-agent", "test-agent")
+    yield BoardClient(board_dir, "test-agent")
+    shutil.rmtree(temp_dir)
+
+
+def test_list_my_issues_by_priority(client):
+    """Test that order_by="priority" ranks the whole column before limiting."""
+    low = client.create_issue("Low", "", "todo", ["test-agent"], priority="low")
+    medium = client.create_issue("Medium", "", "todo", ["test-agent"], priority="medium")
+    high = client.create_issue("High", "", "todo", ["test-agent"], priority="high")
+
+    top = json.loads(client.list_my_issues(column="todo", limit=1, order_by="priority"))
+    assert [i["id"] for i in top] == [high]
+
+    ranked = json.loads(client.list_my_issues(column="todo", order_by="priority"))
+    assert [i["id"] for i in ranked] == [high, medium, low]
+
+    # Ties keep board order
+    also_high = client.create_issue("Also high", "", "todo", ["test-agent"], priority="high")
+    board_order = [i["id"] for i in json.loads(client.list_my_issues(column="todo"))]
+    top_two = json.loads(client.list_my_issues(column="todo", limit=2, order_by="priority"))
+    assert [i["id"] for i in top_two] == [i for i in board_order if i in (high, also_high)]
+
+    with pytest.raises(BoardError):
+        client.list_my_issues(order_by="title")
+
+
+
+def test_create_issues_bulk(client):
+    """Test that bulk creation writes every issue, or none if a spec is bad."""
+    ids = client.create_issues_bulk([
+        {"title": "One", "column": "todo"},
+        {"title": "Two", "priority": "high", "assignees": ["test-agent"]},
+    ])
+    assert len(set(ids)) == 2
+    assert client.find_issue(ids[0])[1]["column"] == "todo"
+    assert client.find_issue(ids[1])[1]["priority"] == "high"
+
+    with pytest.raises(BoardError):
+        client.create_issues_bulk([{"title": "Three"}, {"title": "Four", "column": "nowhere"}])
+    assert len(json.loads(client.list_my_issues())) == 2
+
+    # Schema checks run before the first write too
+    with pytest.raises(BoardError):
+        client.create_issues_bulk([{"title": "Five"}, {"title": None}])
+    assert len(json.loads(client.list_my_issues())) == 2
+
+
+
+def test_iter_issues_by_column(client):
+    """Test that a columns filter only reads those column directories."""
+    todo = client.create_issue("Todo", "", "todo", ["test-agent"])
+    doing = client.create_issue("Doing", "", "doing", ["test-agent"])
+    client.create_issue("Done", "", "done", ["test-agent"])
+
+    ids = {issue["id"] for _, issue in client.iter_issues(columns=("todo", "doing", "missing"))}
+    assert ids == {todo, doing}
+    assert [i["id"] for i in json.loads(client.list_my_issues(column="doing"))] == [doing]
+
+
+
+def test_list_my_issues_by_columns(client):
+    """Test that one call returns ranked, limited buckets for each column."""
+    low = client.create_issue("Low", "", "todo", ["test-agent"], priority="low")
+    high = client.create_issue("High", "", "todo", ["test-agent"], priority="high")
+    doing = client.create_issue("Doing", "", "doing", ["test-agent"])
+    client.create_issue("Done", "", "done", ["test-agent"])
+
+    buckets = client.list_my_issues_by_columns(["doing", "todo", "backlog"], 1, "priority")
+    assert set(buckets) == {"doing", "todo", "backlog"}
+    assert [i["id"] for i in buckets["doing"]] == [doing]
+    assert [i["id"] for i in buckets["todo"]] == [high]
+    assert buckets["backlog"] == []
+
+    todo = client.list_my_issues_by_columns(["todo"])["todo"]
+    assert {i["id"] for i in todo} == {low, high}
+
+
+
+def test_list_recent(client):
+    """Test that list_recent returns a column's most recently written issues first."""
+    first = client.create_issue("First", "", "todo", ["test-agent"])
+    second = client.create_issue("Second", "", "todo", ["test-agent"])
+    client.create_issue("Elsewhere", "", "backlog", ["test-agent"])
+    for issue_id in (second, first):
+        client.move_issue(issue_id, "done", notify_on_completion=False)
+        time.sleep(0.01)  # Distinct mtimes
+
+    assert [i["id"] for i in client.list_recent("done", limit=1)] == [first]
+    assert [i["id"] for i in client.list_recent("done")] == [first, second]
+    assert client.list_recent("doing") == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
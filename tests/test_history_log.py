@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test that task history is capped in the YAML file and archived to a JSONL log.
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crewkan.board_init import init_board
+from crewkan.board_core import BoardClient
+from crewkan.utils import append_history, get_history_log_path, load_history, load_yaml
+
+
+def test_history_overflow_is_archived():
+    """Test that old history entries move to the log and comments survive."""
+    temp_dir = Path(tempfile.mkdtemp())
+    board_dir = temp_dir / "history_board"
+
+    try:
+        init_board(board_dir, "test", "Test Board", "test-agent", "test-agent")
+        client = BoardClient(board_dir, "test-agent")
+        issue_id = client.create_issue("Chatty", "", "todo", ["test-agent"])
+
+        for i in range(60):
+            client.add_comment(issue_id, f"comment {i}")
+
+        path, issue = client.find_issue(issue_id)
+        assert len(load_yaml(path)["history"]) == 50
+        assert get_history_log_path(board_dir, issue_id).exists()
+
+        # Nothing is lost: the created event plus every comment, in order
+        history = load_history(board_dir, issue)
+        assert len(history) == 61
+        assert history[0]["event"] == "created"
+
+        comments = client.get_comments(issue_id)
+        assert [c["details"] for c in comments] == [f"comment {i}" for i in range(60)]
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_append_history_without_board_root_keeps_everything():
+    """Test that history is never trimmed when there is nowhere to archive it."""
+    task = {"id": "I-1", "history": []}
+    for i in range(5):
+        append_history(task, {"event": "updated", "details": str(i)}, max_entries=2)
+    assert len(task["history"]) == 5
+
+
+def test_history_archived_twice_is_loaded_once():
+    """Test that entries re-archived after a failed save aren't duplicated."""
+    temp_dir = Path(tempfile.mkdtemp())
+
+    try:
+        task = {"id": "I-1", "history": []}
+        for i in range(3):
+            append_history(task, {"event": "comment", "details": str(i)}, temp_dir, max_entries=2)
+        # The save of the trimmed task "failed": append again to the untrimmed copy
+        retry = {"id": "I-1", "history": [{"event": "comment", "details": str(i)} for i in range(3)]}
+        append_history(retry, {"event": "comment", "details": "3"}, temp_dir, max_entries=2)
+
+        details = [e["details"] for e in load_history(temp_dir, retry)]
+        assert details == ["0", "1", "2", "3"]
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
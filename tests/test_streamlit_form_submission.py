@@ -261,7 +261,7 @@ def test_form_submission_logs(streamlit_server, page, test_board):
     test_logger.info("Testing form submission logging...")
     
     # Find log file from UI
-    log_files = sorted((Path(__file__).parent.parent / "tmp").glob("crewkan_ui_*.log"))
+    log_files = sorted((Path(__file__).parent.parent / "tmp").glob("crewkan_ui.log"))
     if not log_files:
         test_logger.warning("No UI log files found")
         return
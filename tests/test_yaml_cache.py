@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test the load_yaml parse cache in crewkan/utils.py.
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crewkan import utils
+from crewkan.utils import load_yaml, save_yaml, clear_yaml_cache
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Count calls into the YAML parser made by load_yaml."""
+    calls = []
+    real_load = utils.yaml.load
+
+    def counting_load(stream, Loader):
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)
+
+    clear_yaml_cache()
+    monkeypatch.setattr(utils.yaml, "load", counting_load)
+    yield calls
+    clear_yaml_cache()
+
+
+def test_unchanged_file_is_parsed_once(parse_counter):
+    """Test that repeated loads of an unchanged file hit the cache."""
+    temp_dir = Path(tempfile.mkdtemp())
+    test_file = temp_dir / "test.yaml"
+
+    try:
+        save_yaml(test_file, {"name": "cached", "version": 1})
+        for _ in range(3):
+            assert load_yaml(test_file)["name"] == "cached"
+        assert len(parse_counter) == 1
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_save_invalidates_and_copies_are_independent(parse_counter):
+    """Test that writes are picked up and callers can't corrupt the cache."""
+    temp_dir = Path(tempfile.mkdtemp())
+    test_file = temp_dir / "test.yaml"
+
+    try:
+        save_yaml(test_file, {"items": [1], "version": 1})
+        first = load_yaml(test_file)
+        first["items"].append(2)
+        assert load_yaml(test_file)["items"] == [1]
+
+        save_yaml(test_file, {"items": [1, 2, 3], "version": 1})
+        assert load_yaml(test_file)["items"] == [1, 2, 3]
+
+        # Edits made outside save_yaml change the (inode, mtime, size) key
+        test_file.write_text("items: [4]\nversion: 1\n", encoding="utf-8")
+        assert load_yaml(test_file)["items"] == [4]
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_cache_is_bounded(parse_counter, monkeypatch):
+    """Test that the least recently used entries are evicted."""
+    temp_dir = Path(tempfile.mkdtemp())
+    monkeypatch.setattr(utils, "YAML_CACHE_MAX_ENTRIES", 2)
+
+    try:
+        paths = [temp_dir / f"f{i}.yaml" for i in range(3)]
+        for i, path in enumerate(paths):
+            save_yaml(path, {"n": i, "version": 1})
+            load_yaml(path)
+        assert len(utils._yaml_cache) == 2
+        assert paths[0] not in utils._yaml_cache
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])